@@ -1,7 +1,6 @@
 import hou
 import os
 import json
-import glob
 import re
 import logging
 import shutil
@@ -10,28 +9,73 @@ import subprocess
 import asyncio
 import traceback
 import importlib
+import atexit
 import time
+import threading
+import hashlib
+import mmap
+from collections import OrderedDict
 from pathlib import Path
 from typing import List, Dict, Optional, Tuple
-from functools import partial
+from functools import partial, lru_cache
 from concurrent.futures import ThreadPoolExecutor
 from contextlib import contextmanager
 
 from PIL import Image
 import toolutils
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 from PySide2 import QtWidgets, QtCore, QtGui
 from PySide2.QtCore import Qt, QTimer, QSize, QSettings
 from PySide2.QtGui import QMovie, QPixmap, QImage, QPainter, QWheelEvent, QIcon, QFont
 from PySide2.QtWidgets import (QGraphicsView, QGraphicsScene, QGraphicsPixmapItem, 
-                               QProgressDialog, QApplication, QMainWindow, QTreeWidget)
+                               QProgressDialog, QMainWindow, QTreeWidget)
 
 
 
 # Constants
 SUPPORTED_EXTENSIONS = ['.uti']
+IMAGE_EXTENSIONS = frozenset(('png', 'jpg', 'jpeg'))
 MAX_PREVIEW_SIZE = QtCore.QSize(400, 300)
 FLIPBOOK_FRAME_RATE = 24  # fps
+FLIPBOOK_FRAME_CACHE = 48  # decoded frames the large preview keeps in memory
+FLIPBOOK_PREFETCH = 8  # frames decoded ahead of the playhead
+MASTER_FLUSH_DELAY_MS = 500  # coalesce master.json writes within this window
+STATUS_MESSAGE_TIMEOUT_MS = 3000
+PROGRESS_DISPATCH_INTERVAL = 16  # repaint the progress dialog every Nth update
+PREFERENCE_SAVE_DELAY_MS = 100  # coalesce preference-file writes from rapid toggles
+SNAPSHOT_RESIZE_DELAY_MS = 40  # smooth-scale the snapshot once a drag-resize pauses
+FILTER_DEBOUNCE_MS = 150  # wait for typing to pause before filtering the file list
+THUMB_CACHE_VERSION = 1  # bump to invalidate every cached thumbnail
+# master.json preview entries, relative to the user's Snips folder
+FLIPBOOK_ENTRY_TEMPLATE = "/preview/flipbook/{name}/{name}.$F4.png"
+SNAP_ENTRY_TEMPLATE = "/preview/snapshot/{name}.png"
+PRELOAD_RANGE = 2  # files preloaded above and below the selection
+MAX_PREVIEW_CACHE = 32  # previews hold decoded flipbook frames, keep this small
+MAX_PREVIEW_CACHE_BYTES = 256 * 1024 * 1024  # decoded pixels across every cached preview
+SNAPSHOT_PIXMAP_CACHE_KB = 100 * 1024  # floor for Qt's process-wide QPixmapCache, shared with Houdini
+# Name parts of a snip file, in file-name order, and the file list's columns
+NAME_COLUMNS = ('Context', 'Type', 'Name', 'Source', 'Version')
+FILE_LIST_HEADERS = NAME_COLUMNS + ('Date Modified', 'Size')
+# Columns kept per snip file by scan_file_rows, and the ones indexed for filtering/grouping
+FILE_ROW_FIELDS = ('path', 'context', 'type', 'name', 'source', 'version', 'mtime', 'size')
+FILE_INDEX_FIELDS = ('context', 'type', 'source')
+GROUP_FIELDS = {"Type": 'type', "Context": 'context', "Source": 'source'}
+# Zero-width split points before each capital after the first character
+CAMEL_BOUNDARY_RE = re.compile(r'(?<!^)(?=[A-Z])')
+# Deletes every ASCII character that is not a letter, digit or space
+NAME_STRIP_TABLE = str.maketrans('', '', ''.join(chr(c) for c in range(128) if not (chr(c).isalnum() or chr(c) == ' ')))
+
+# One worker pool for preview decoding and file I/O, shared by every window.
+# The shelf tool reloads this module on each click, so keep the existing pool
+PREVIEW_WORKERS = os.cpu_count() or 4
+if '_PREVIEW_POOL' not in globals():
+    _PREVIEW_POOL = ThreadPoolExecutor(max_workers=PREVIEW_WORKERS, thread_name_prefix="snip-io")
+    atexit.register(_PREVIEW_POOL.shutdown, wait=False)
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
@@ -51,6 +95,253 @@ except Exception as e:
 
 
 
+@lru_cache(maxsize=8)
+def _master_path_for(base_path: Path, user: str) -> Path:
+    return Path(base_path) / 'pyDump' / user / 'Snips' / 'descriptions' / 'master.json'
+
+
+@lru_cache(maxsize=32)
+def _frame_pattern(file_name: str) -> re.Pattern:
+    # "name.$F4.png" -> a regex matching "name.0001.png", "name.-001.png", ...
+    pattern = re.escape(file_name).replace(r'\$F4', r'-?\d+').replace(r'\$F', r'-?\d+')
+    return re.compile(pattern)
+
+
+def _scan_images(directory: Path, name_pattern: Optional[re.Pattern] = None) -> List[Path]:
+    # One directory listing, filtered in Python, instead of glob's per-entry work
+    try:
+        with os.scandir(directory) as entries:
+            if name_pattern is not None:
+                names = [entry.name for entry in entries if name_pattern.fullmatch(entry.name) and entry.is_file()]
+            else:
+                names = [entry.name for entry in entries
+                         if entry.name.rpartition('.')[2].lower() in IMAGE_EXTENSIONS and entry.is_file()]
+    except OSError:
+        return []
+    names.sort()
+    return [directory / name for name in names]
+
+
+@contextmanager
+def bulk_update(widget: QtWidgets.QWidget):
+    # Repaint and signal once after a bulk change instead of once per item
+    widget.setUpdatesEnabled(False)
+    widget.blockSignals(True)
+    try:
+        yield widget
+    finally:
+        widget.blockSignals(False)
+        widget.setUpdatesEnabled(True)
+
+
+@lru_cache(maxsize=4096)
+def _format_name(input_string: str) -> str:
+    # Remove special characters, keeping ASCII letters, digits and spaces
+    if not input_string.isascii():
+        input_string = input_string.encode('ascii', 'ignore').decode('ascii')
+    cleaned = input_string.translate(NAME_STRIP_TABLE)
+    
+    # Split the string into words
+    words = cleaned.split()
+    
+    # Capitalize the first letter of each word except the first one
+    formatted = words[0].lower() + ''.join(word.capitalize() for word in words[1:])
+    
+    return formatted
+
+
+@lru_cache(maxsize=4096)
+def _camel_case_to_words(name: str) -> str:
+    # Called for every row on each scan, with the same few names over and over
+    words = CAMEL_BOUNDARY_RE.sub(' ', name).split()
+    return ' '.join(word.capitalize() for word in words)
+
+
+@lru_cache(maxsize=4096)
+def _format_mtime(seconds: int) -> str:
+    # Files saved in one session share timestamps, and rebuilds format the same ones again
+    return time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(seconds))
+
+
+def _scale_preview(image: QtGui.QImage, target: QtCore.QSize) -> QtGui.QImage:
+    # Halve cheaply while far above the target, so the smooth filter only
+    # runs on an image at most twice the preview size
+    while image.width() > target.width() * 2 and image.height() > target.height() * 2:
+        image = image.scaled(image.width() // 2, image.height() // 2, QtCore.Qt.KeepAspectRatio, QtCore.Qt.FastTransformation)
+    return image.scaled(target, QtCore.Qt.KeepAspectRatio, QtCore.Qt.SmoothTransformation)
+
+
+def _display_format(image: QtGui.QImage) -> QtGui.QImage:
+    # The raster paint engine blits these two formats without a per-pixel conversion
+    target = QImage.Format_ARGB32_Premultiplied if image.hasAlphaChannel() else QImage.Format_RGB32
+    return image if image.format() == target else image.convertToFormat(target)
+
+
+def _pixmap_bytes(pixmap: QtGui.QPixmap) -> int:
+    return pixmap.width() * pixmap.height() * pixmap.depth() // 8
+
+
+def _snapshot_cache_key(snapshot_path) -> str:
+    # QPixmapCache is shared with the rest of Houdini, so namespace the keys
+    return f"snip-snapshot:{snapshot_path}"
+
+
+def _fitted_cache_key(pixmap: QtGui.QPixmap, size: QtCore.QSize) -> str:
+    # cacheKey follows the pixmap's data, so a replaced snapshot never matches an old entry
+    return f"snip-fitted:{pixmap.cacheKey()}:{size.width()}x{size.height()}"
+
+
+def _read_preview_image(image_path: str, target: QtCore.QSize) -> Optional[QtGui.QImage]:
+    reader = QtGui.QImageReader(image_path)
+    if not reader.canRead():  # missing or unrecognised file: bail out on the header alone
+        return None
+    reader.setAutoTransform(True)
+    source_size = reader.size()
+    # Decoders with native scaling (JPEG) skip producing the full-resolution pixels
+    if (source_size.isValid() and reader.supportsOption(QtGui.QImageIOHandler.ScaledSize)
+            and (source_size.width() > target.width() or source_size.height() > target.height())):
+        reader.setScaledSize(source_size.scaled(target, QtCore.Qt.KeepAspectRatio))
+    image = reader.read()
+    if image.isNull():
+        return None
+    return _display_format(_scale_preview(image, target))
+
+
+def _frame_chunks(frames: List, parts: int) -> List[List]:
+    # Contiguous slices, so chunks decoded in parallel concatenate back in frame order
+    step = max(1, -(-len(frames) // max(1, parts)))
+    return [frames[i:i + step] for i in range(0, len(frames), step)]
+
+
+def _remove_flipbook_dir(directory: Path) -> None:
+    # Flipbook folders are a flat frame sequence: one listing and an unlink per
+    # entry, skipping rmtree's per-level lstat/open/fstat bookkeeping
+    with os.scandir(directory) as entries:
+        for entry in entries:
+            if entry.is_dir(follow_symlinks=False):
+                shutil.rmtree(entry.path)
+            else:
+                os.unlink(entry.path)
+    os.rmdir(directory)
+
+
+def _sync_directories(directories) -> None:
+    for directory in directories:
+        try:
+            fd = os.open(directory, os.O_RDONLY)
+        except OSError:  # Windows can't open a directory handle; NTFS journals renames itself
+            continue
+        try:
+            os.fsync(fd)
+        except OSError:
+            pass
+        finally:
+            os.close(fd)
+
+
+def _rename_batch(groups: List[Tuple[str, List[Tuple[str, str]]]]) -> Dict[str, OSError]:
+    # Issue every rename back to back and flush each touched directory once at
+    # the end, rather than interleaving scans and executor hops between them.
+    # A group stops at its first failure; a failure in the first group aborts the batch.
+    failures = {}
+    touched = set()
+    for index, (label, pairs) in enumerate(groups):
+        try:
+            for source, destination in pairs:
+                os.rename(source, destination)
+                touched.add(os.path.dirname(destination))
+        except OSError as e:
+            failures[label] = e
+            if index == 0:
+                break
+    _sync_directories(touched)
+    return failures
+
+
+def read_master_json(master_json_path: Path) -> List[Dict]:
+    if orjson is not None:
+        with master_json_path.open('rb') as f:
+            if os.fstat(f.fileno()).st_size == 0:  # mmap refuses empty files
+                return orjson.loads(b'')
+            # Parse straight out of the page cache instead of copying into a bytes object first
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm, memoryview(mm) as view:
+                return orjson.loads(view)
+    with master_json_path.open('r') as f:
+        return json.load(f)
+
+
+def write_json_atomic(json_path: Path, data) -> None:
+    # These files are indexes and prefs rather than hand-edited, so keep them
+    # compact unless debug logging asks for something readable
+    readable = logger.isEnabledFor(logging.DEBUG)
+    if orjson is not None:
+        payload = orjson.dumps(data, option=orjson.OPT_INDENT_2 if readable else 0)
+    elif readable:
+        payload = json.dumps(data, indent=4).encode('utf-8')
+    else:
+        payload = json.dumps(data, separators=(',', ':')).encode('utf-8')
+
+    # Write to a sibling temp file and swap it in, so a crash mid-write
+    # can never leave a truncated file behind
+    tmp_path = json_path.with_suffix('.json.tmp')
+    with tmp_path.open('wb') as f:
+        f.write(payload)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp_path, json_path)
+
+
+def write_master_json(master_json_path: Path, master_data: List[Dict]) -> None:
+    write_json_atomic(master_json_path, master_data)
+
+
+def _write_settings(organization: str, application: str, values: Dict) -> None:
+    # Runs on the worker pool: the values are read off the widgets on the GUI
+    # thread and this private QSettings instance does the disk sync
+    try:
+        settings = QSettings(organization, application)
+        for key, value in values.items():
+            settings.setValue(key, value)
+        settings.sync()
+    except Exception as e:
+        logger.error(f"Error saving settings for {application}: {e}")
+
+
+def _write_dialog_preference(pref_file: Path, show_dialogs: bool) -> None:
+    try:
+        write_json_atomic(pref_file, {'show_dialogs': show_dialogs})
+    except Exception as e:
+        logger.error(f"Error saving dialog preference: {e}")
+
+
+class ItemMeta:
+    # What a file row keeps under Qt.UserRole. The path string doubles as the
+    # file_items_by_path key; the Path is only built the first time a handler asks for it.
+    # search_text is the row's column texts, lowered once for filter_files
+    __slots__ = ('file_path', '_path', 'search_text')
+
+    def __init__(self, file_path: str, texts=()):
+        self.file_path = file_path
+        self._path = None
+        # The separator can't be typed, so a query never matches across two columns
+        self.search_text = '\x1f'.join(texts).lower()
+
+    @property
+    def path(self) -> Path:
+        if self._path is None:
+            self._path = Path(self.file_path)
+        return self._path
+
+    @property
+    def stem(self) -> str:
+        return self.path.stem
+
+
+def _item_file_path(item: Optional[QtWidgets.QTreeWidgetItem]) -> Optional[str]:
+    # Group rows carry no ItemMeta
+    meta = item.data(0, QtCore.Qt.UserRole) if item is not None else None
+    return meta.file_path if meta is not None else None
+
 
 class FileManager:
     def __init__(self, base_path: str):
@@ -58,10 +349,13 @@ class FileManager:
 
     def get_users(self) -> List[str]:
         pyDump_path = self.base_path / 'pyDump'
-        if pyDump_path.exists():
-            return [d.name for d in pyDump_path.iterdir() if d.is_dir()]
-        logger.warning(f"pyDump directory not found at {pyDump_path}")
-        return [hou.getenv("USER")]
+        try:
+            # scandir answers is_dir() from the directory listing instead of a stat per entry
+            with os.scandir(pyDump_path) as entries:
+                return [entry.name for entry in entries if entry.is_dir()]
+        except FileNotFoundError:
+            logger.warning(f"pyDump directory not found at {pyDump_path}")
+            return [hou.getenv("USER")]
 
     def load_json_data(self):
         user = self.user_combo.currentText()
@@ -73,11 +367,9 @@ class FileManager:
             
             # Create empty master.json if it doesn't exist
             if not master_json_path.exists():
-                with master_json_path.open('w') as f:
-                    json.dump([], f)
+                write_master_json(master_json_path, [])
             
-            with master_json_path.open('r') as f:
-                self.json_data = json.load(f)
+            self.json_data = read_master_json(master_json_path)
                 
             if not isinstance(self.json_data, list):
                 logger.warning("JSON data is not a list, initializing empty list")
@@ -94,70 +386,135 @@ class FileManager:
             logger.warning(f"Warning: Preview path does not exist: {preview_path}")
         return preview_path
 
+class ThumbnailCache:
+    def __init__(self, cache_dir: Path):
+        self.cache_dir = Path(cache_dir) / f"v{THUMB_CACHE_VERSION}"
+
+    def cache_path(self, image_path: str, size: QtCore.QSize) -> Optional[Path]:
+        try:
+            stat = os.stat(image_path)
+        except OSError:
+            return None
+        path_hash = hashlib.sha1(image_path.encode('utf-8')).hexdigest()
+        key = f"{image_path}|{stat.st_mtime_ns}|{stat.st_size}|{size.width()}x{size.height()}"
+        return self.cache_dir / path_hash[:2] / f"{hashlib.sha1(key.encode('utf-8')).hexdigest()}.png"
+
+    def load_scaled(self, image_path: str, size: QtCore.QSize) -> Optional[QImage]:
+        # QImage only, so this is safe to call from worker threads
+        cache_path = self.cache_path(image_path, size)
+        if cache_path is not None:
+            cached = QImage(str(cache_path))
+            if not cached.isNull():
+                return _display_format(cached)
+
+        image = _read_preview_image(image_path, size)
+        if image is None:
+            return None
+
+        if cache_path is not None:
+            try:
+                cache_path.parent.mkdir(parents=True, exist_ok=True)
+                tmp_path = cache_path.with_suffix(f".{threading.get_ident()}.tmp")
+                if image.save(str(tmp_path), "PNG"):
+                    os.replace(tmp_path, cache_path)
+            except OSError as e:
+                logger.debug(f"Could not write thumbnail cache for {image_path}: {e}")
+        return image
+
 class PreviewManager:
-    def __init__(self, max_preview_size: QtCore.QSize):
+    def __init__(self, max_preview_size: QtCore.QSize, thumbnail_cache: Optional[ThumbnailCache] = None):
         self.max_preview_size = max_preview_size
+        self.thumbnail_cache = thumbnail_cache
         self.flipbook_frames = []
         self.current_frame = 0
 
-    def load_flipbook(self, flipbook_path: str) -> List[QtGui.QPixmap]:
-        self.flipbook_frames = []
-        
+    # The read_* methods only touch QImage and may run on worker threads;
+    # the load_* wrappers build the QPixmaps and must stay on the GUI thread
+    def _load_scaled(self, image_path: str) -> Optional[QImage]:
+        if self.thumbnail_cache is not None:
+            return self.thumbnail_cache.load_scaled(image_path, self.max_preview_size)
+        return _read_preview_image(image_path, self.max_preview_size)
+
+    def read_flipbook(self, flipbook_path: str, executor: Optional[ThreadPoolExecutor] = None) -> List[QImage]:
         logger.debug(f"Loading flipbook from: {flipbook_path}")
         
+        # A missing directory simply lists no frames
         directory = Path(flipbook_path).parent
-        if not directory.exists():
-            logger.warning(f"Directory does not exist: {directory}")
-            return self.flipbook_frames
-
-        image_files = self._get_image_files(flipbook_path)
+        image_files = self.list_frames(flipbook_path)
 
         logger.debug(f"Found {len(image_files)} image files")
         if not image_files:
             logger.warning(f"No image files found in directory: {directory}")
-            return self.flipbook_frames
+            return []
 
-        self.flipbook_frames = self._load_flipbook_frames(image_files)
+        frames = self.read_frames(image_files, executor)
+        logger.debug(f"Loaded {len(frames)} frames for flipbook")
+        return frames
 
-        logger.debug(f"Loaded {len(self.flipbook_frames)} frames for flipbook")
+    def load_flipbook(self, flipbook_path: str) -> List[QtGui.QPixmap]:
+        images = self.read_flipbook(flipbook_path, _PREVIEW_POOL)
+        self.flipbook_frames = [QtGui.QPixmap.fromImage(image) for image in images]
         return self.flipbook_frames
 
-    def _get_image_files(self, flipbook_path: str) -> List[Path]:
+    def read_frames(self, image_files: List[Path], executor: Optional[ThreadPoolExecutor] = None) -> List[QImage]:
+        # PNG decoding releases the GIL, so with an executor each worker decodes one
+        # contiguous chunk. Never pass the pool this is already running on: a worker
+        # blocking on its own pool can starve it
+        if executor is None or len(image_files) < 2:
+            return self._load_flipbook_frames(image_files)
+        chunks = _frame_chunks(image_files, PREVIEW_WORKERS)
+        return [frame for chunk in executor.map(self._load_flipbook_frames, chunks) for frame in chunk]
+
+    def list_frames(self, flipbook_path: str) -> List[Path]:
         path = Path(flipbook_path)
         if '$F' in flipbook_path:
-            file_pattern = path.name.replace('$F4', '*').replace('$F', '*')
-            return sorted(path.parent.glob(file_pattern))
+            return _scan_images(path.parent, _frame_pattern(path.name))
         elif path.is_file():
             return [path]
         elif path.is_dir():
-            return sorted(path.glob('*.[pj][np][gg]'))
+            return _scan_images(path)
         return []
 
-    def _load_flipbook_frames(self, image_files: List[Path]) -> List[QtGui.QPixmap]:
+    def _load_flipbook_frames(self, image_files: List[Path]) -> List[QImage]:
         frames = []
         for image_file in image_files:
-            pixmap = QtGui.QPixmap(str(image_file))
-            if not pixmap.isNull():
-                scaled_pixmap = pixmap.scaled(self.max_preview_size, QtCore.Qt.KeepAspectRatio, QtCore.Qt.SmoothTransformation)
-                frames.append(scaled_pixmap)
+            scaled_image = self._load_scaled(str(image_file))
+            if scaled_image is not None:
+                frames.append(scaled_image)
                 logger.debug(f"Loaded image: {image_file}")
             else:
                 logger.warning(f"Failed to load image: {image_file}")
         return frames
 
+    def read_snapshot(self, snapshot_path: str) -> Optional[QImage]:
+        # Callers check presence through the preview scan; a missing file just fails to read
+        scaled_image = self._load_scaled(snapshot_path)
+        if scaled_image is not None:
+            logger.debug(f"Loaded snapshot: {snapshot_path}")
+            return scaled_image
+        logger.warning(f"Failed to load snapshot: {snapshot_path}")
+        return None
+
     def load_snapshot(self, snapshot_path: str) -> Optional[QtGui.QPixmap]:
-        if Path(snapshot_path).exists():
-            pixmap = QtGui.QPixmap(snapshot_path)
-            if not pixmap.isNull():
-                scaled_pixmap = pixmap.scaled(self.max_preview_size, QtCore.Qt.KeepAspectRatio, QtCore.Qt.SmoothTransformation)
-                logger.debug(f"Loaded snapshot: {snapshot_path}")
-                return scaled_pixmap
-            else:
-                logger.warning(f"Failed to load snapshot: {snapshot_path}")
-        else:
-            logger.warning(f"Snapshot file not found: {snapshot_path}")
+        pixmap = self.cached_snapshot(snapshot_path)
+        if pixmap is not None:
+            return pixmap
+        return self.cache_snapshot(snapshot_path, self.read_snapshot(snapshot_path))
+
+    # QPixmapCache is GUI-thread only, like the QPixmaps it holds
+    def cached_snapshot(self, snapshot_path: str) -> Optional[QtGui.QPixmap]:
+        pixmap = QtGui.QPixmap()
+        if QtGui.QPixmapCache.find(_snapshot_cache_key(snapshot_path), pixmap):
+            return pixmap
         return None
 
+    def cache_snapshot(self, snapshot_path: str, image: Optional[QImage]) -> Optional[QtGui.QPixmap]:
+        if image is None:
+            return None
+        pixmap = QtGui.QPixmap.fromImage(image)
+        QtGui.QPixmapCache.insert(_snapshot_cache_key(snapshot_path), pixmap)
+        return pixmap
+
 class CheckableComboBox(QtWidgets.QComboBox):
     def __init__(self, parent=None):
         super().__init__(parent)
@@ -188,7 +545,9 @@ class ClickableLabel(QtWidgets.QLabel):
         super().mousePressEvent(event)
 
 class LargePreviewWindow(QtWidgets.QDialog):
-    def __init__(self, parent=None):
+    frame_decoded = QtCore.Signal(int, int, QImage)  # generation, frame index, image
+
+    def __init__(self, parent=None, thread_pool=None):
         super().__init__(parent)
         self.setWindowTitle("Large Preview")
         self.setWindowFlags(QtCore.Qt.Tool | QtCore.Qt.WindowStaysOnTopHint)
@@ -211,6 +570,8 @@ class LargePreviewWindow(QtWidgets.QDialog):
         
         self.graphics_view = QGraphicsView(self)
         self.graphics_scene = QGraphicsScene(self)
+        # A single item swapping pixmaps 24 times a second gains nothing from the BSP index
+        self.graphics_scene.setItemIndexMethod(QGraphicsScene.NoIndex)
         self.graphics_view.setScene(self.graphics_scene)
         self.graphics_view.setRenderHint(QtGui.QPainter.SmoothPixmapTransform)
         self.graphics_view.setDragMode(QGraphicsView.ScrollHandDrag)
@@ -253,12 +614,21 @@ class LargePreviewWindow(QtWidgets.QDialog):
         screen_rect = QtWidgets.QApplication.desktop().screenGeometry()
         self.setMinimumSize(screen_rect.width() // 2, screen_rect.height() // 2)
 
-        self.flipbook_frames = []
         self.current_frame = 0
         self.timer = QTimer(self)
         self.timer.timeout.connect(self.update_flipbook_frame)
         self.frame_rate = 24
 
+        # Frames are streamed: only a window around the playhead is decoded,
+        # to QImage on worker threads and into QPixmaps on the GUI thread
+        self.thread_pool = thread_pool or _PREVIEW_POOL
+        self.frame_paths = []
+        self.frame_cache = OrderedDict()  # frame index -> QPixmap, least recently shown first
+        self.frame_futures = {}  # frame index -> decode in flight
+        self.failed_frames = set()
+        self.flipbook_generation = 0  # bumped per flipbook so stale decodes are dropped
+        self.frame_decoded.connect(self.on_frame_decoded)
+
         self.settings = QSettings("YourCompany", "SnipLibraryLargePreview")
         self.load_settings()
 
@@ -322,56 +692,108 @@ class LargePreviewWindow(QtWidgets.QDialog):
 
     def set_flipbook(self, flipbook_folder):
         self.path_line_edit.setText(f"Flipbook: {flipbook_folder}")
-        self.flipbook_frames.clear()
+        self.cancel_frame_decodes()
+        self.flipbook_generation += 1
+        self.frame_cache.clear()
+        self.failed_frames = set()
         self.current_frame = 0
-        
-        image_files = sorted(Path(flipbook_folder).glob('*.png'))
-        if not image_files:
+
+        try:
+            with os.scandir(flipbook_folder) as entries:
+                frame_paths = [entry.path for entry in entries if entry.name.endswith('.png')]
+        except OSError:
+            frame_paths = []
+        if not frame_paths:
             print(f"No image files found in flipbook folder: {flipbook_folder}")
             return
 
-        first_frame = QtGui.QPixmap(str(image_files[0]))
+        # Frame 0 only needs the smallest name, a single pass; the full sort
+        # waits until the first frame is on screen
+        first_path = min(frame_paths)
+        self.frame_paths = [first_path]
+        generation = self.flipbook_generation
+        QtCore.QTimer.singleShot(0, lambda: self.set_frame_paths(generation, frame_paths))
+
+        first_frame = QtGui.QPixmap.fromImage(_display_format(QImage(first_path)))
         if not first_frame.isNull():
-            self.flipbook_frames.append(first_frame)
+            self.cache_frame(0, first_frame)
             self.graphics_scene.clear()
             self.pixmap_item = QGraphicsPixmapItem(first_frame)
             self.graphics_scene.addItem(self.pixmap_item)
             self.graphics_scene.setSceneRect(first_frame.rect())
             self.set_window_size(first_frame.width(), first_frame.height())
-            
-            progress = QProgressDialog("Loading frames...", "Cancel", 0, len(image_files) - 1, self)
-            progress.setWindowModality(QtCore.Qt.WindowModal)
-            progress.setMinimumDuration(0)
-            progress.setValue(0)
-            
-            QtCore.QTimer.singleShot(0, lambda: self.load_remaining_frames(image_files[1:], progress))
-            
+
             self.timer.start(1000 // self.frame_rate)
         else:
-            print(f"Failed to load first frame: {image_files[0]}")
+            print(f"Failed to load first frame: {first_path}")
 
-    def load_remaining_frames(self, image_files, progress):
-        for i, image_file in enumerate(image_files):
-            if progress.wasCanceled():
-                break
-            pixmap = QtGui.QPixmap(str(image_file))
-            if not pixmap.isNull():
-                self.flipbook_frames.append(pixmap)
-            else:
-                print(f"Failed to load image: {image_file}")
-            progress.setValue(i + 1)
-        progress.close()
-        print(f"Loaded {len(self.flipbook_frames)} frames")
+    def set_frame_paths(self, generation: int, frame_paths: List[str]):
+        if generation != self.flipbook_generation:
+            return
+        frame_paths.sort()
+        self.frame_paths = frame_paths
+        self.prefetch_frames()
+
+    def prefetch_frames(self):
+        num_frames = len(self.frame_paths)
+        wanted = [(self.current_frame + offset) % num_frames for offset in range(1, min(FLIPBOOK_PREFETCH, num_frames - 1) + 1)]
+
+        # Queued decodes the playhead has moved away from are dropped
+        for index in set(self.frame_futures) - set(wanted):
+            if self.frame_futures[index].cancel():
+                del self.frame_futures[index]
+
+        # Submitted nearest first, so the pool works through them in playback order
+        for index in wanted:
+            if index in self.frame_cache or index in self.frame_futures or index in self.failed_frames:
+                continue
+            self.frame_futures[index] = self.thread_pool.submit(
+                self.decode_frame, self.flipbook_generation, index, self.frame_paths[index])
+
+    def decode_frame(self, generation: int, index: int, image_path: str):
+        # Runs on a worker thread; the signal is queued to the GUI thread
+        self.frame_decoded.emit(generation, index, _display_format(QImage(image_path)))
+
+    def on_frame_decoded(self, generation: int, index: int, image: QImage):
+        if generation != self.flipbook_generation:  # Decoded for a flipbook no longer shown
+            return
+        self.frame_futures.pop(index, None)
+        if image.isNull():
+            print(f"Failed to load image for frame {index}")
+            self.failed_frames.add(index)
+        else:
+            self.cache_frame(index, QtGui.QPixmap.fromImage(image))
+
+    def cache_frame(self, index: int, pixmap: QPixmap):
+        self.frame_cache[index] = pixmap
+        self.frame_cache.move_to_end(index)
+        while len(self.frame_cache) > FLIPBOOK_FRAME_CACHE:
+            self.frame_cache.popitem(last=False)
+
+    def cancel_frame_decodes(self):
+        for future in self.frame_futures.values():
+            future.cancel()
+        self.frame_futures = {}
 
     def update_flipbook_frame(self):
-        if self.flipbook_frames:
-            num_frames = len(self.flipbook_frames)
-            if num_frames > 0:
-                self.current_frame = (self.current_frame + 1) % num_frames
-                self.pixmap_item.setPixmap(self.flipbook_frames[self.current_frame])
-            else:
-                print("Flipbook has no frames.")
-                self.clear_flipbook()
+        num_frames = len(self.frame_paths)
+        if num_frames > len(self.failed_frames):
+            previous_frame = self.frame_cache.get(self.current_frame)
+            next_frame = (self.current_frame + 1) % num_frames
+            while next_frame in self.failed_frames:
+                next_frame = (next_frame + 1) % num_frames
+
+            frame = self.frame_cache.get(next_frame)
+            if frame is None:
+                # Not decoded yet: hold the current frame rather than skip ahead
+                self.prefetch_frames()
+                return
+            self.frame_cache.move_to_end(next_frame)
+            self.current_frame = next_frame
+            # Single-frame flipbooks never change
+            if frame is not previous_frame:
+                self.pixmap_item.setPixmap(frame)
+            self.prefetch_frames()
         else:
             print("No flipbook frames available.")
             self.clear_flipbook()
@@ -388,7 +810,8 @@ class LargePreviewWindow(QtWidgets.QDialog):
         self.preview_manager.flipbook_frames = []
 
     def save_settings(self):
-        self.settings.setValue("geometry", self.saveGeometry())
+        values = {"geometry": self.saveGeometry()}
+        self.thread_pool.submit(_write_settings, self.settings.organizationName(), self.settings.applicationName(), values)
 
     def load_settings(self):
         if self.settings.contains("geometry"):
@@ -396,6 +819,9 @@ class LargePreviewWindow(QtWidgets.QDialog):
 
     def closeEvent(self, event):
         self.timer.stop()
+        self.cancel_frame_decodes()
+        self.flipbook_generation += 1  # anything still queued for this flipbook is dropped
+        self.frame_cache.clear()
         self.save_settings()
         super().closeEvent(event)
 
@@ -437,7 +863,7 @@ class EditableTreeWidget(QtWidgets.QTreeWidget):
         selected_items = self.file_list_widget.selectedItems()
         if selected_items and not selected_items[0].childCount():
             selected_item = selected_items[0]
-            file_path = selected_item.data(0, Qt.UserRole)
+            file_path = selected_item.data(0, Qt.UserRole).file_path
             # Use QTimer to delay the preview update
             QtCore.QTimer.singleShot(0, lambda: self.update_preview(file_path))
         else:
@@ -468,19 +894,15 @@ class EditableTreeWidget(QtWidgets.QTreeWidget):
             yield item
             item = get_next_item(item)
 
-class NameEditorDelegate(QtWidgets.QStyledItemDelegate):
-    def createEditor(self, parent, option, index):
-        editor = super().createEditor(parent, option, index)
-        if isinstance(editor, QtWidgets.QLineEdit):
-            editor.editingFinished.connect(lambda: self.commitAndCloseEditor(editor))
-        return editor
-
-    def commitAndCloseEditor(self, editor):
-        self.commitData.emit(editor)
-        self.closeEditor.emit(editor)
-
 class MyShelfToolUI(QtWidgets.QWidget):
     instances = []
+    snapshot_converted = QtCore.Signal(str, str)
+    preview_deleted = QtCore.Signal(str, str, str)  # kind, file path, error
+    item_renamed = QtCore.Signal(str, str, int, object)  # old file path, new name, column, {group: error}
+    preview_prefetched = QtCore.Signal(str, object)  # stem, (json_data, frames, snapshot path, snapshot)
+    # Per-column normalisation of an edited name part: Context, Type, Name, Source, Version
+    COLUMN_TRANSFORMS = (str.upper, str, str, str, str.lower)
+    QUESTION_BUTTONS = QtWidgets.QMessageBox.Yes | QtWidgets.QMessageBox.No
 
     @classmethod
     def close_existing_windows(cls):
@@ -503,7 +925,8 @@ class MyShelfToolUI(QtWidgets.QWidget):
             raise ValueError("EFX environment variable is not set or invalid")
 
         self.file_manager = FileManager(str(self.base_path))
-        self.preview_manager = PreviewManager(MAX_PREVIEW_SIZE)
+        self.preview_manager = PreviewManager(MAX_PREVIEW_SIZE, ThumbnailCache(self.base_path / '.cache' / 'thumbs'))
+        QtGui.QPixmapCache.setCacheLimit(max(QtGui.QPixmapCache.cacheLimit(), SNAPSHOT_PIXMAP_CACHE_KB))
 
         self.preview_visible = True  # or False, depending on your default preference
         self.flipbook_timer = QtCore.QTimer(self)
@@ -512,12 +935,33 @@ class MyShelfToolUI(QtWidgets.QWidget):
         self.settings = QSettings("YourCompany", "SnipLibraryUI")
 
         self.current_snapshot_path = None
+        self.snapshot_source_pixmap = None  # full-size snapshot behind the scaled preview
+        self.snapshot_scaled_key = None  # (source cacheKey, label size) currently on screen
+        self._cached_user = None
+        self.path_cache = {}
         self.file_groups = {}
-        self.json_cache = {}
-        self.preview_cache = {}
-        # self.thread_pool = ThreadPoolExecutor(max_workers=4)
-        self.thread_pool = ThreadPoolExecutor(max_workers=os.cpu_count())
-
+        self.file_items_by_path = {}
+        self.file_rows = {field: [] for field in FILE_ROW_FIELDS}  # column -> one value per snip
+        self.file_index = {field: {} for field in FILE_INDEX_FIELDS}  # column -> {value: set(row)}
+        self.file_rows_user = None  # user the rows were scanned for; None forces a rescan
+        self.last_filter_key = None  # (user, group, sources) the tree was last built for
+        self.last_filter_text = None
+        self.filter_timer = QTimer(self)
+        self.filter_timer.setSingleShot(True)
+        self.filter_timer.setInterval(FILTER_DEBOUNCE_MS)
+        self.filter_timer.timeout.connect(self.filter_files)
+        self.preference_save_timer = QTimer(self)
+        self.preference_save_timer.setSingleShot(True)
+        self.preference_save_timer.setInterval(PREFERENCE_SAVE_DELAY_MS)
+        self.preference_save_timer.timeout.connect(self.save_dialog_preference)
+        self.snapshot_resize_timer = QTimer(self)
+        self.snapshot_resize_timer.setSingleShot(True)
+        self.snapshot_resize_timer.setInterval(SNAPSHOT_RESIZE_DELAY_MS)
+        self.snapshot_resize_timer.timeout.connect(self.rescale_snapshot)
+        self.has_preview = {}
+        self.json_data = []
+        self.preview_cache = OrderedDict()  # bounded LRU of loaded previews, see _cache_put
+        self.thread_pool = _PREVIEW_POOL
 
         self.progress_dialog = None
         self.close_timer = QTimer(self)
@@ -525,15 +969,39 @@ class MyShelfToolUI(QtWidgets.QWidget):
         self.close_timer.timeout.connect(self.force_close_progress_dialog)
 
         self.cache_timer = QtCore.QTimer(self)
-        self.cache_timer.timeout.connect(self.clear_cache)
-        self.cache_timer.start(300000)  # Clear cache every 5 minutes (300,000 ms)
+        self.cache_timer.timeout.connect(self.revalidate_cache)
+        self.cache_timer.start(300000)  # Check master.json for outside changes every 5 minutes (300,000 ms)
 
-        self.update_preview_timer = QtCore.QTimer()
+        # Zero-delay and restarted per selection, so only the last file picked is decoded
+        self.update_preview_timer = QtCore.QTimer(self)
         self.update_preview_timer.setSingleShot(True)
-        self.update_preview_timer.timeout.connect(self._update_preview)
+        self.update_preview_timer.setInterval(0)
+        self.update_preview_timer.timeout.connect(self.load_pending_preview)
+        self.pending_preview = None  # (json_data, stem) waiting for update_preview_timer
         self.current_file_path = None
         self.preview_semaphore = asyncio.Semaphore(1)
         self.current_task = None
+        self.preload_tasks = {}  # stem -> pool future decoding a neighbour's preview
+
+        # self.json_data is the in-memory copy of master.json; edits mark it
+        # dirty and are written back once per batch by flush_master_json
+        self.master_json_path = None
+        self.master_index = {}
+        self.master_cache = {}  # master.json path -> (mtime_ns, json_data, master_index)
+        self.master_dirty = False
+        self.master_disk_stems = set()  # stems in master.json as of the last read or flush
+        self.master_lock = threading.Lock()
+        self.master_flush_timer = QTimer(self)
+        self.master_flush_timer.setSingleShot(True)
+        self.master_flush_timer.timeout.connect(self.flush_master_json)
+
+        # Snapshot capture waits for Houdini's main window to activate;
+        # this timer is only a fallback if the window manager never reports it
+        self.pending_snapshot = None
+        self.snapshot_main_window = None
+        self.snapshot_fallback_timer = QTimer(self)
+        self.snapshot_fallback_timer.setSingleShot(True)
+        self.snapshot_fallback_timer.timeout.connect(self.fire_pending_snapshot)
 
         self.setup_ui()
         self.setup_file_list_widget()
@@ -557,10 +1025,80 @@ class MyShelfToolUI(QtWidgets.QWidget):
     #             log_widget_hierarchy(child, level + 1)
 
 
-    def clear_cache(self):
-        self.json_cache.clear()
-        self.preview_cache.clear()
-        logger.info("Application cache automatically cleared")
+    @property
+    def _user(self) -> str:
+        # Read the combo once and reuse it until the selection changes
+        if self._cached_user is None:
+            self._cached_user = self.user_combo.currentText()
+        return self._cached_user
+
+    def _on_user_index_changed(self):
+        # Store the new user up front so hot paths never have to query the combo
+        self._cached_user = self.user_combo.currentText()
+
+    def _preview_paths(self) -> Dict[str, Path]:
+        # Preview folders only change with the user, so build them once per user
+        user = self._user
+        paths = self.path_cache.get(user)
+        if paths is None:
+            preview_base_path = self.file_manager.get_preview_base_path(user)
+            paths = self.path_cache[user] = {
+                'snips': self.base_path / 'pyDump' / user / 'Snips',
+                'base': preview_base_path,
+                'flipbook': preview_base_path / 'flipbook',
+                'snapshot': preview_base_path / 'snapshot',
+                'master_json': _master_path_for(self.base_path, user),
+            }
+        return paths
+
+    def revalidate_cache(self):
+        # The caches only go stale when master.json is changed by someone else
+        if self.master_json_path is None or self.master_dirty:
+            return
+        try:
+            mtime_ns = self.master_json_path.stat().st_mtime_ns
+        except OSError:
+            return
+        cached = self.master_cache.get(self.master_json_path)
+        if cached is None or cached[0] != mtime_ns:
+            logger.info("master.json changed on disk, reloading")
+            self.load_json_data()
+            # Only previews whose entry actually changed are dropped; the rest stay warm
+            stale = [stem for stem, preview in self.preview_cache.items()
+                     if preview['json_data'] != self.master_index.get(stem)]
+            for stem in stale:
+                self.invalidate_cache(stem)
+
+    @staticmethod
+    def _cache_put(cache: OrderedDict, key, value, max_size: int):
+        cache[key] = value
+        cache.move_to_end(key)
+        while len(cache) > max_size:
+            cache.popitem(last=False)
+
+    def cache_preview(self, stem: str, json_data: Dict, flipbook_frames: List[QtGui.QPixmap], snapshot_pixmap: Optional[QtGui.QPixmap]):
+        pixmaps = list(flipbook_frames) + ([snapshot_pixmap] if snapshot_pixmap else [])
+        self._cache_put(self.preview_cache, stem, {
+            'json_data': json_data,
+            'flipbook_frames': flipbook_frames,
+            'snapshot_pixmap': snapshot_pixmap,
+            'bytes': sum(_pixmap_bytes(pixmap) for pixmap in pixmaps),
+        }, MAX_PREVIEW_CACHE)
+        # A flipbook can be one frame or hundreds, so the entry count alone doesn't bound memory
+        total = sum(preview['bytes'] for preview in self.preview_cache.values())
+        while total > MAX_PREVIEW_CACHE_BYTES and len(self.preview_cache) > 1:
+            _, evicted = self.preview_cache.popitem(last=False)
+            total -= evicted['bytes']
+
+    def invalidate_cache(self, stem: str):
+        # The caches hold one entry per file stem, so invalidation is a direct pop
+        self.preview_cache.pop(stem, None)
+        self.has_preview.pop(stem, None)
+        QtGui.QPixmapCache.remove(_snapshot_cache_key(self._preview_paths()['snapshot'] / f"{stem}.png"))
+        # A preload still in flight would put the stale entry straight back
+        preload_task = self.preload_tasks.pop(stem, None)
+        if preload_task is not None:
+            preload_task.cancel()
 
     def show_progress_dialog(self, title, message, maximum):
         self.progress_dialog = QProgressDialog(message, "Cancel", 0, maximum, self)
@@ -569,12 +1107,19 @@ class MyShelfToolUI(QtWidgets.QWidget):
         self.progress_dialog.setMinimumDuration(0)
         self.progress_dialog.setValue(0)
         self.progress_dialog.show()
-        QApplication.processEvents()
-        
+        self.dispatch_progress_events()
+
     def update_progress(self, value):
         if self.progress_dialog:
             self.progress_dialog.setValue(value)
-            QApplication.processEvents()
+            if value % PROGRESS_DISPATCH_INTERVAL == 0 or value >= self.progress_dialog.maximum():
+                self.dispatch_progress_events()
+
+    def dispatch_progress_events(self):
+        # Deliver only the dialog's own pending events; processEvents() would
+        # re-enter the event loop and run unrelated slots mid-update
+        QtCore.QCoreApplication.sendPostedEvents(self.progress_dialog, 0)
+        QtCore.QCoreApplication.flush()
 
     def close_progress_dialog(self):
         if self.progress_dialog:
@@ -590,7 +1135,6 @@ class MyShelfToolUI(QtWidgets.QWidget):
             logger.debug("Progress dialog forcibly closed")
         else:
             logger.warning("No progress dialog to close")
-        QApplication.processEvents()
         self.activateWindow()
         self.raise_()
 
@@ -598,7 +1142,8 @@ class MyShelfToolUI(QtWidgets.QWidget):
         self.setWindowTitle("My Setup Library")
         self.setMinimumSize(1200, 800)
 
-        main_layout = QtWidgets.QHBoxLayout(self)  # Change to QHBoxLayout
+        root_layout = QtWidgets.QVBoxLayout(self)
+        main_layout = QtWidgets.QHBoxLayout()  # Change to QHBoxLayout
         
         # Create left layout (file list)
         left_layout = self.create_left_layout()
@@ -609,6 +1154,12 @@ class MyShelfToolUI(QtWidgets.QWidget):
         # Add layouts to main layout
         main_layout.addLayout(left_layout, 2)
         main_layout.addLayout(right_layout, 1)
+        root_layout.addLayout(main_layout)
+
+        # Non-modal feedback for edits that should not stop the UI
+        self.status_bar = QtWidgets.QStatusBar()
+        self.status_bar.setSizeGripEnabled(False)
+        root_layout.addWidget(self.status_bar)
 
         # Remove the content_layout and nested layouts
 
@@ -625,7 +1176,6 @@ class MyShelfToolUI(QtWidgets.QWidget):
         self.file_list_widget.itemSelectionChanged.connect(self.on_selection_changed)
         self.file_list_widget.setFocusPolicy(Qt.StrongFocus)
         self.file_list_widget.itemChanged.connect(self.on_item_changed)
-        self.file_list_widget.itemSelectionChanged.connect(self.update_preview)
 
         self.file_list_widget.setStyleSheet("""
             QTreeWidget::item:selected {
@@ -644,8 +1194,10 @@ class MyShelfToolUI(QtWidgets.QWidget):
         selected_items = self.file_list_widget.selectedItems()
         if selected_items and not selected_items[0].childCount():
             selected_item = selected_items[0]
-            file_path = selected_item.data(0, Qt.UserRole)
+            file_path = selected_item.data(0, Qt.UserRole).file_path
             self.update_preview(file_path)
+            # Queued behind the selected file's own load, which is also a zero-delay timer
+            QtCore.QTimer.singleShot(0, self.preload_nearby_items)
             # Ensure the item remains selected
             self.file_list_widget.setCurrentItem(selected_item)
         else:
@@ -667,6 +1219,7 @@ class MyShelfToolUI(QtWidgets.QWidget):
         self.user_checkbox.setChecked(True)
         self.user_checkbox.stateChanged.connect(self.on_user_filter_toggled)
         self.user_combo = QtWidgets.QComboBox()
+        self.user_combo.currentIndexChanged.connect(self._on_user_index_changed)
         self.populate_user_combo()
         self.user_combo.currentTextChanged.connect(self.on_user_changed)
         user_layout.addWidget(self.user_checkbox)
@@ -712,7 +1265,7 @@ class MyShelfToolUI(QtWidgets.QWidget):
         search_label = QtWidgets.QLabel("Filter Files:")
         self.filter_line_edit = QtWidgets.QLineEdit()
         self.filter_line_edit.setPlaceholderText("Enter search term...")
-        self.filter_line_edit.textChanged.connect(self.filter_files)
+        self.filter_line_edit.textChanged.connect(self.schedule_filter_files)
         search_layout.addWidget(search_label)
         search_layout.addWidget(self.filter_line_edit)
 
@@ -723,7 +1276,7 @@ class MyShelfToolUI(QtWidgets.QWidget):
 
         # Add the file list widget
         self.file_list_widget = QtWidgets.QTreeWidget(self)
-        self.file_list_widget.setHeaderLabels(["Context", "Type", "Name", "Source", "Version", "Date Modified", "Size"])
+        self.file_list_widget.setHeaderLabels(list(FILE_LIST_HEADERS))
         layout.addWidget(self.file_list_widget)
 
         # Create buttons
@@ -892,153 +1445,21 @@ class MyShelfToolUI(QtWidgets.QWidget):
 
         return layout
 
-    def connect_signals(self):
-        self.user_combo.currentTextChanged.connect(self.on_user_changed)
-        self.group_combo.currentTextChanged.connect(self.on_group_changed)
-        self.filter_line_edit.textChanged.connect(self.filter_files)
-        self.load_button.clicked.connect(self.load_action)
-        self.delete_button.clicked.connect(self.delete_selected_file)
-        self.refresh_button.clicked.connect(self.refresh_ui)
-        self.close_button.clicked.connect(self.close)
-        self.toggle_preview_checkbox.stateChanged.connect(self.toggle_preview)
-
-    def populate_user_combo(self):
-        users = self.file_manager.get_users()
-        self.user_combo.clear()
-        self.user_combo.addItems(users)
-        current_user = hou.getenv("USER")
-        if current_user in users:
-            self.user_combo.setCurrentText(current_user)
-        elif users:
-            self.user_combo.setCurrentText(users[0])
-
-    async def update_preview_async(self):
-        selected_items = self.file_list_widget.selectedItems()
-        if selected_items and not selected_items[0].childCount():
-            selected_item = selected_items[0]
-            file_path = Path(selected_item.data(0, QtCore.Qt.UserRole))
-            
-            json_data = await self.load_json_data_async(file_path.stem)
-            if json_data:
-                self.format_preview_text(json_data)
-                await self.load_preview_assets_async(json_data)
-            else:
-                self.clear_preview()
-
-    def on_item_changed(self, item, column):
-        if not item or item.childCount() > 0:  # Ignore group items
-            return
-
-        try:
-            old_full_name = Path(item.data(0, QtCore.Qt.UserRole)).stem
-            parts = old_full_name.split('_')
-            
-            if len(parts) != 5:
-                self.show_error_dialog("Invalid Name Format", "The file name does not follow the expected format.")
-                return
-
-            new_value = item.text(column)
-            formatted_value = self.format_name(new_value)
-
-            new_parts = parts.copy()
-            if column == 0:  # Context
-                new_parts[0] = formatted_value.upper()
-            elif column == 1:  # Type
-                new_parts[1] = formatted_value
-            elif column == 2:  # Name
-                new_parts[2] = formatted_value
-            elif column == 3:  # Source
-                new_parts[3] = formatted_value
-            elif column == 4:  # Version
-                new_parts[4] = formatted_value.lower()
-
-            new_full_name = '_'.join(new_parts)
-            
-            # Only update if the name has actually changed
-            if new_full_name != old_full_name:
-                self.update_item_name(item, new_full_name, column)
-            else:
-                # If no change, just update the displayed text to the formatted version
-                item.setText(column, new_parts[column])
-
-        except Exception as e:
-            self.show_error_dialog("Update Failed", f"An error occurred while updating the item: {str(e)}")
-
-    def update_item_name(self, item, new_full_name, updated_column):
-        old_file_path = Path(item.data(0, QtCore.Qt.UserRole))
-        old_full_name = old_file_path.stem
-        user = self.user_combo.currentText()
-        
-        # Update the file name
-        new_file_path = old_file_path.with_name(f"{new_full_name}{old_file_path.suffix}")
-        try:
-            old_file_path.rename(new_file_path)
-        except Exception as e:
-            self.show_error_dialog("Rename Failed", f"Failed to rename file: {e}")
-            # Revert the name change in the UI
-            old_parts = old_full_name.split('_')
-            item.setText(updated_column, old_parts[updated_column])
-            return
-
-        # Update flipbook directory and image sequence
-        old_flipbook_dir = self.base_path / 'pyDump' / user / 'Snips' / 'preview' / 'flipbook' / old_full_name
-        new_flipbook_dir = self.base_path / 'pyDump' / user / 'Snips' / 'preview' / 'flipbook' / new_full_name
-        if old_flipbook_dir.exists():
-            try:
-                # Rename image sequence files
-                for old_file in old_flipbook_dir.glob(f"{old_full_name}.*"):
-                    frame_number = old_file.stem.split('.')[-1]
-                    new_file_name = f"{new_full_name}.{frame_number}{old_file.suffix}"
-                    old_file.rename(old_flipbook_dir / new_file_name)
-                
-                # Rename the directory
-                old_flipbook_dir.rename(new_flipbook_dir)
-            except Exception as e:
-                self.show_error_dialog("Flipbook Update Failed", f"Failed to update flipbook: {e}")
-
-        # Update snapshot
-        old_snapshot_path = self.base_path / 'pyDump' / user / 'Snips' / 'preview' / 'snapshot' / f"{old_full_name}.png"
-        new_snapshot_path = self.base_path / 'pyDump' / user / 'Snips' / 'preview' / 'snapshot' / f"{new_full_name}.png"
-        if old_snapshot_path.exists():
-            try:
-                old_snapshot_path.rename(new_snapshot_path)
-            except Exception as e:
-                self.show_error_dialog("Snapshot Update Failed", f"Failed to update snapshot: {e}")
-
-        # Update the item's data
-        item.setData(0, QtCore.Qt.UserRole, str(new_file_path))
-
-        self.show_info_dialog("Name Updated", f"Successfully updated the {['Context', 'Type', 'Name', 'Source', 'Version'][updated_column]}")
-        self.refresh_ui()
-
-    def format_name(self, input_string):
-        # Remove special characters and spaces
-        cleaned = re.sub(r'[^a-zA-Z0-9 ]', '', input_string)
-        
-        # Split the string into words
-        words = cleaned.split()
-        
-        # Capitalize the first letter of each word except the first one
-        formatted = words[0].lower() + ''.join(word.capitalize() for word in words[1:])
-        
-        return formatted
-
     def show_large_flipbook_preview(self):
         selected_items = self.file_list_widget.selectedItems()
         if not selected_items or selected_items[0].childCount() > 0:
             return
 
         selected_item = selected_items[0]
-        file_path = Path(selected_item.data(0, QtCore.Qt.UserRole))
+        file_path = selected_item.data(0, QtCore.Qt.UserRole).path
         file_name = file_path.stem
 
-        user = self.user_combo.currentText()
-        flipbook_folder = self.base_path / 'pyDump' / user / "Snips" / "preview" / "flipbook" / file_name
+        flipbook_folder = self._preview_paths()['flipbook'] / file_name
 
-        if not flipbook_folder.exists():
+        if not self.preview_exists(file_name, 'flipbook', flipbook_folder):
             return
 
-        preview_window = LargePreviewWindow(self)
+        preview_window = LargePreviewWindow(self, thread_pool=self.thread_pool)
         preview_window.set_flipbook(str(flipbook_folder))
         preview_window.show()
         preview_window.raise_()  # Bring the window to the front
@@ -1050,13 +1471,12 @@ class MyShelfToolUI(QtWidgets.QWidget):
             return
 
         selected_item = selected_items[0]
-        file_path = Path(selected_item.data(0, QtCore.Qt.UserRole))
+        file_path = selected_item.data(0, QtCore.Qt.UserRole).path
         file_name = file_path.stem
 
-        user = self.user_combo.currentText()
-        snapshot_path = self.base_path / 'pyDump' / user / "Snips" / "preview" / "snapshot" / f"{file_name}.png"
+        snapshot_path = self._preview_paths()['snapshot'] / f"{file_name}.png"
 
-        if not snapshot_path.exists():
+        if not self.preview_exists(file_name, 'snapshot', snapshot_path):
             return
 
         preview_window = LargePreviewWindow(self)
@@ -1065,124 +1485,58 @@ class MyShelfToolUI(QtWidgets.QWidget):
         preview_window.raise_()  # Bring the window to the front
         preview_window.activateWindow()  # Activate the window
 
-    def delete_flipbook(self):
-        logger.debug("Delete Flipbook button clicked")
-        selected_items = self.file_list_widget.selectedItems()
-        if not selected_items or selected_items[0].childCount() > 0:
-            self.show_warning_dialog("Invalid Selection", "Please select a valid file to delete its flipbook.")
-            return
-
-        selected_item = selected_items[0]
-        file_path = Path(selected_item.data(0, QtCore.Qt.UserRole))
-        file_name = file_path.stem
+    def update_snapshot_preview(self, snapshot):
+        logger.debug(f"Updating snapshot preview with: {snapshot}")
+        if isinstance(snapshot, str) or isinstance(snapshot, Path):
+            # A fresh capture replaces whatever was cached for this path. Loading it
+            # like any other snapshot decodes straight to preview size instead of
+            # holding the full-resolution screen grab
+            QtGui.QPixmapCache.remove(_snapshot_cache_key(snapshot))
+            pixmap = self.preview_manager.load_snapshot(str(snapshot))
+            if pixmap is not None:
+                self.snapshot_source_pixmap = pixmap
+                self.rescale_snapshot()
+                self.current_snapshot_path = snapshot
+            else:
+                logger.warning(f"Failed to load snapshot: {snapshot}")
+                self.clear_snapshot()
+        elif isinstance(snapshot, QtGui.QPixmap):
+            self.snapshot_source_pixmap = snapshot
+            self.rescale_snapshot()
+            self.current_snapshot_path = None  # We don't have a file path in this case
+        else:
+            logger.error(f"Invalid snapshot type: {type(snapshot)}")
+            self.clear_snapshot()
 
-        user = self.user_combo.currentText()
-        flipbook_folder = self.base_path / 'pyDump' / user / "Snips" / "preview" / "flipbook" / file_name
+    def scale_pixmap_to_fit(self, pixmap: QtGui.QPixmap, target_size: QtCore.QSize) -> QtGui.QPixmap:
+        # Scale the pixmap to fit within the target size while maintaining aspect ratio.
+        # The preview labels are AlignCenter, so no padded copy is painted around it
+        return pixmap.scaled(target_size, QtCore.Qt.KeepAspectRatio, QtCore.Qt.SmoothTransformation)
 
-        if not flipbook_folder.exists():
-            self.show_warning_dialog("No Flipbook", "There is no flipbook to delete for this file.")
+    def rescale_snapshot(self):
+        # Scales the already-decoded snapshot, so resizes never go back to disk
+        if self.snapshot_source_pixmap is None:
             return
-
-        reply = self.show_question_dialog("Delete Flipbook", 
-                                          "Are you sure you want to delete this flipbook?",
-                                          QtWidgets.QMessageBox.Yes | QtWidgets.QMessageBox.No,
-                                          QtWidgets.QMessageBox.No)
-        if reply == QtWidgets.QMessageBox.Yes:
-            try:
-                shutil.rmtree(flipbook_folder)
-                logger.info(f"Flipbook deleted successfully: {flipbook_folder}")
-                self.update_flipbook_path_in_json(file_name, "")
-                self.show_info_dialog("Flipbook Deleted", "The flipbook has been successfully deleted.")
-                self.refresh_ui()
-                self.reselect_file(file_path)
-            except Exception as e:
-                logger.error(f"Error deleting flipbook: {e}")
-                self.show_error_dialog("Flipbook Deletion Failed", f"Failed to delete flipbook: {e}")
-
-    def delete_snapshot(self):
-        logger.debug("Delete Snapshot button clicked")
-        selected_items = self.file_list_widget.selectedItems()
-        if not selected_items or selected_items[0].childCount() > 0:
-            self.show_warning_dialog("Invalid Selection", "Please select a valid file to delete its snapshot.")
+        # The label is usually fixed-size, so most window resizes leave it untouched
+        target_size = self.snapshot_preview.size()
+        scaled_key = (self.snapshot_source_pixmap.cacheKey(), target_size.width(), target_size.height())
+        if scaled_key == self.snapshot_scaled_key:
             return
+        # Going back to a recently shown file at the same label size reuses its smooth-scaled copy
+        fitted_key = _fitted_cache_key(self.snapshot_source_pixmap, target_size)
+        scaled = QtGui.QPixmap()
+        if not QtGui.QPixmapCache.find(fitted_key, scaled):
+            scaled = self.scale_pixmap_to_fit(self.snapshot_source_pixmap, target_size)
+            if scaled.size() != self.snapshot_source_pixmap.size():  # Already fits: nothing was resampled
+                QtGui.QPixmapCache.insert(fitted_key, scaled)
+        self.snapshot_preview.setPixmap(scaled)
+        self.snapshot_scaled_key = scaled_key
 
-        selected_item = selected_items[0]
-        file_path = Path(selected_item.data(0, QtCore.Qt.UserRole))
-        file_name = file_path.stem
-
-        user = self.user_combo.currentText()
-        snapshot_path = self.base_path / 'pyDump' / user / "Snips" / "preview" / "snapshot" / f"{file_name}.png"
-
-        if not snapshot_path.exists():
-            self.show_warning_dialog("No Snapshot", "There is no snapshot to delete for this file.")
-            return
-
-        reply = self.show_question_dialog("Delete Snapshot", 
-                                          "Are you sure you want to delete this snapshot?",
-                                          QtWidgets.QMessageBox.Yes | QtWidgets.QMessageBox.No,
-                                          QtWidgets.QMessageBox.No)
-        if reply == QtWidgets.QMessageBox.Yes:
-            try:
-                snapshot_path.unlink()
-                logger.info(f"Snapshot deleted successfully: {snapshot_path}")
-                self.update_snapshot_path_in_json(file_name, "")
-                self.show_info_dialog("Snapshot Deleted", "The snapshot has been successfully deleted.")
-                self.refresh_ui()
-                self.reselect_file(file_path)
-            except Exception as e:
-                logger.error(f"Error deleting snapshot: {e}")
-                self.show_error_dialog("Snapshot Deletion Failed", f"Failed to delete snapshot: {e}")
-
-    def update_snapshot_preview(self, snapshot):
-        logger.debug(f"Updating snapshot preview with: {snapshot}")
-        if isinstance(snapshot, str) or isinstance(snapshot, Path):
-            if Path(snapshot).exists():
-                pixmap = QtGui.QPixmap(str(snapshot))
-                if not pixmap.isNull():
-                    scaled_pixmap = pixmap.scaled(self.snapshot_preview.size(), QtCore.Qt.KeepAspectRatio, QtCore.Qt.SmoothTransformation)
-                    self.snapshot_preview.setPixmap(scaled_pixmap)
-                    self.current_snapshot_path = snapshot
-                else:
-                    logger.warning(f"Failed to load snapshot: {snapshot}")
-                    self.snapshot_preview.setText("Failed to load snapshot")
-                    self.current_snapshot_path = None
-            else:
-                logger.warning(f"Snapshot file not found: {snapshot}")
-                self.clear_snapshot()
-        elif isinstance(snapshot, QtGui.QPixmap):
-            scaled_pixmap = snapshot.scaled(self.snapshot_preview.size(), QtCore.Qt.KeepAspectRatio, QtCore.Qt.SmoothTransformation)
-            self.snapshot_preview.setPixmap(scaled_pixmap)
-            self.current_snapshot_path = None  # We don't have a file path in this case
-        else:
-            logger.error(f"Invalid snapshot type: {type(snapshot)}")
-            self.clear_snapshot()
-
-    def scale_pixmap_to_fit(self, pixmap: QtGui.QPixmap, target_size: QtCore.QSize) -> QtGui.QPixmap:
-        # Scale the pixmap to fit within the target size while maintaining aspect ratio
-        scaled_pixmap = pixmap.scaled(target_size, QtCore.Qt.KeepAspectRatio, QtCore.Qt.SmoothTransformation)
-        
-        # Create a new pixmap with the target size and transparent background
-        result_pixmap = QtGui.QPixmap(target_size)
-        result_pixmap.fill(QtCore.Qt.transparent)
-        
-        # Create a painter to draw on the result pixmap
-        painter = QtGui.QPainter(result_pixmap)
-        
-        # Calculate the position to center the scaled pixmap
-        x = (target_size.width() - scaled_pixmap.width()) // 2
-        y = (target_size.height() - scaled_pixmap.height()) // 2
-        
-        # Draw the scaled pixmap centered on the result pixmap
-        painter.drawPixmap(x, y, scaled_pixmap)
-        painter.end()
-        
-        return result_pixmap
-
-    def resizeEvent(self, event: QtGui.QResizeEvent):
-        super().resizeEvent(event)
-        # Update the snapshot preview when the window is resized
-        if hasattr(self, 'snapshot_preview') and self.current_snapshot_path:
-            self.update_snapshot_preview(self.current_snapshot_path)
+    def resizeEvent(self, event: QtGui.QResizeEvent):
+        super().resizeEvent(event)
+        # Rescale the snapshot preview once the resize settles
+        if hasattr(self, 'snapshot_preview') and self.snapshot_source_pixmap is not None:
+            self.snapshot_resize_timer.start()
 
     def setup_show_dialogs_checkbox(self):
         self.show_dialogs_checkbox = QtWidgets.QCheckBox("Show information dialogs")
@@ -1191,21 +1545,19 @@ class MyShelfToolUI(QtWidgets.QWidget):
             padding-top: 8px;
             border-top: 1px solid #555555;
         """)
-        self.show_dialogs_checkbox.stateChanged.connect(self.save_dialog_preference)
+        # stateChanged carries the check state, which start() would take as an interval
+        self.show_dialogs_checkbox.stateChanged.connect(lambda _state: self.preference_save_timer.start())
         return self.show_dialogs_checkbox
 
+    def dialog_preference_path(self) -> Path:
+        return Path(hou.expandString('$HOUDINI_USER_PREF_DIR')) / 'snip_ui_preferences.json'
+
     def save_dialog_preference(self):
-        preference = self.show_dialogs_checkbox.isChecked()
-        try:
-            pref_file = Path(hou.expandString('$HOUDINI_USER_PREF_DIR')) / 'snip_ui_preferences.json'
-            with pref_file.open('w') as f:
-                json.dump({'show_dialogs': preference}, f)
-        except Exception as e:
-            logger.error(f"Error saving dialog preference: {e}")
+        _write_dialog_preference(self.dialog_preference_path(), self.show_dialogs_checkbox.isChecked())
 
     def load_dialog_preference(self):
         try:
-            pref_file = Path(hou.expandString('$HOUDINI_USER_PREF_DIR')) / 'snip_ui_preferences.json'
+            pref_file = self.dialog_preference_path()
             if pref_file.exists():
                 with pref_file.open('r') as f:
                     prefs = json.load(f)
@@ -1228,11 +1580,9 @@ class MyShelfToolUI(QtWidgets.QWidget):
         else:
             logger.warning(f"{title}: {message}")
 
-    def show_info_dialog(self, title: str, message: str):
-        if self.show_dialogs_checkbox.isChecked():
-            QtWidgets.QMessageBox.information(self, title, message)
-        else:
-            logger.info(f"{title}: {message}")
+    def show_status_message(self, message: str):
+        self.status_bar.showMessage(message, STATUS_MESSAGE_TIMEOUT_MS)
+        logger.info(message)
 
     def show_error_dialog(self, title: str, message: str):
         if self.show_dialogs_checkbox.isChecked():
@@ -1240,7 +1590,7 @@ class MyShelfToolUI(QtWidgets.QWidget):
         else:
             logger.error(f"{title}: {message}")
 
-    def show_question_dialog(self, title: str, message: str, buttons=QtWidgets.QMessageBox.Yes | QtWidgets.QMessageBox.No, default_button=QtWidgets.QMessageBox.No):
+    def show_question_dialog(self, title: str, message: str, buttons=QUESTION_BUTTONS, default_button=QtWidgets.QMessageBox.No):
         if self.show_dialogs_checkbox.isChecked():
             return QtWidgets.QMessageBox.question(self, title, message, buttons, default_button)
         else:
@@ -1248,18 +1598,22 @@ class MyShelfToolUI(QtWidgets.QWidget):
             return QtWidgets.QMessageBox.Yes  # Always return 'Yes' when dialogs are off
 
     def closeEvent(self, event: QtGui.QCloseEvent):
+        self.flush_master_json()
+        if self.preference_save_timer.isActive():
+            self.preference_save_timer.stop()
+            # Same as save_settings: only the disk write leaves the GUI thread
+            self.thread_pool.submit(_write_dialog_preference, self.dialog_preference_path(), self.show_dialogs_checkbox.isChecked())
         self.save_settings()
         super().closeEvent(event)
 
     def connect_signals(self):
-        self.user_combo.currentTextChanged.connect(self.on_user_changed)
-        self.group_combo.currentTextChanged.connect(self.on_group_changed)
-        self.filter_line_edit.textChanged.connect(self.filter_files)
-        self.load_button.clicked.connect(self.load_action)
-        self.delete_button.clicked.connect(self.delete_selected_file)
-        self.refresh_button.clicked.connect(self.refresh_ui)
-        self.close_button.clicked.connect(self.close)
+        # The combos, the search field and the Load/Delete/Refresh/Close buttons
+        # are wired in create_left_layout; a second connect would run each click twice
         self.toggle_preview_checkbox.stateChanged.connect(self.toggle_preview)
+        self.snapshot_converted.connect(self.on_snapshot_converted)
+        self.preview_deleted.connect(self.on_preview_deleted)
+        self.item_renamed.connect(self.on_item_renamed)
+        self.preview_prefetched.connect(self.on_preview_prefetched)
 
     def populate_user_combo(self):
         users = self.file_manager.get_users()
@@ -1294,57 +1648,145 @@ class MyShelfToolUI(QtWidgets.QWidget):
             self.user_combo.setCurrentText(users[0])
 
     def on_user_changed(self):
-        self.load_json_data()
-        logger.info(f"Loaded JSON data for user {self.user_combo.currentText()}: {len(self.json_data)}")
+        # The new user's Snips folder is scanned while their master.json parses on the pool
+        self.load_json_data(while_parsing=self.prescan_file_rows)
+        logger.info(f"Loaded JSON data for user {self._user}: {len(self.json_data)}")
         self.update_ui_for_new_user()
-        self.update_file_list()
+        self.update_file_list(rescan=False)
         self.populate_source_filter()
         self.clear_preview()
 
     def on_group_changed(self):
-        self.update_file_list()
-   
-    def update_file_list(self):
+        self.update_file_list(rescan=False)
+
+    def prescan_file_rows(self):
+        # Scan the rows update_file_list will ask for, so its own rescan is skipped
+        selected_user = self._user if self.user_checkbox.isChecked() else None
+        self.scan_file_rows(self._preview_paths()['snips'] if selected_user else None)
+        self.file_rows_user = selected_user
+
+    def scan_file_rows(self, category_path: Optional[Path]):
+        """Read the Snips folder once into per-column lists plus value -> rows indexes."""
+        rows = {field: [] for field in FILE_ROW_FIELDS}
+        index = {field: {} for field in FILE_INDEX_FIELDS}
+        try:
+            entries = list(os.scandir(category_path)) if category_path else []
+        except FileNotFoundError:
+            entries = []
+
+        for entry in entries:
+            stem, ext = os.path.splitext(entry.name)
+            if ext not in SUPPORTED_EXTENSIONS:
+                continue
+            parts = stem.split('_')
+            if len(parts) < 5:
+                logger.warning(f"Skipping file {entry.path} due to incorrect name format")
+                continue
+            context, file_type, *name_parts, source, version = parts
+            try:
+                stat = entry.stat()
+            except OSError as e:
+                logger.error(f"Error processing file {entry.path}: {str(e)}")
+                continue
+
+            values = {
+                'path': str(category_path / entry.name),
+                'context': context,
+                'type': file_type,
+                'name': self.camel_case_to_words('_'.join(name_parts)),
+                'source': source,
+                'version': version,
+                'mtime': stat.st_mtime,
+                'size': stat.st_size,
+            }
+            row = len(rows['path'])
+            for field in FILE_ROW_FIELDS:
+                rows[field].append(values[field])
+            for field in FILE_INDEX_FIELDS:
+                index[field].setdefault(values[field], set()).add(row)
+
+        self.file_rows = rows
+        self.file_index = index
+        logger.info(f"Scanned {len(rows['path'])} files in {category_path}")
+
+    def build_file_row(self, row: int) -> QtWidgets.QTreeWidgetItem:
+        rows = self.file_rows
+        date_modified_str = _format_mtime(int(rows['mtime'][row]))
+        texts = [rows['context'][row], rows['type'][row], rows['name'][row], rows['source'][row],
+                 rows['version'][row], date_modified_str, f"{rows['size'][row] / 1024:.2f} KB"]
+        file_item = QtWidgets.QTreeWidgetItem(texts)
+        file_item.setData(0, QtCore.Qt.UserRole, ItemMeta(rows['path'][row], texts))
+        file_item.setFlags(file_item.flags() | QtCore.Qt.ItemIsEditable)
+        self.file_items_by_path[rows['path'][row]] = file_item
+        return file_item
+
+    def update_file_list(self, rescan=True):
         logger.info("Starting update_file_list")
-        selected_user = self.user_combo.currentText() if self.user_checkbox.isChecked() else None
+        selected_user = self._user if self.user_checkbox.isChecked() else None
         selected_group = self.group_combo.currentText() if self.group_checkbox.isChecked() else None
         selected_sources = self.get_selected_sources() if self.source_checkbox.isChecked() else None
 
         logger.info(f"Selected user: {selected_user}, group: {selected_group}, sources: {selected_sources}")
 
         current_item = self.file_list_widget.currentItem()
-        current_file_path = current_item.data(0, QtCore.Qt.UserRole) if current_item else None
+        current_file_path = _item_file_path(current_item)
 
-        self.file_list_widget.clear()
-        self.file_groups = {}  # Reset file_groups here
+        # Duplicate signals and toggles that leave the filters as they were don't rebuild the tree
+        filter_key = (selected_user, selected_group, frozenset(selected_sources) if selected_sources else None)
+        if not rescan and filter_key == self.last_filter_key and selected_user == self.file_rows_user:
+            logger.debug("File list filters unchanged, skipping rebuild")
+            return
+        self.last_filter_key = filter_key
 
-        category_path = self.base_path / 'pyDump' / selected_user / 'Snips' if selected_user else None
-        logger.info(f"Category path: {category_path}")
+        # Filter and group toggles reuse the last scan; only a refresh or another user hits the disk
+        if rescan or selected_user != self.file_rows_user:
+            category_path = self._preview_paths()['snips'] if selected_user else None
+            self.scan_file_rows(category_path)
+            self.file_rows_user = selected_user
 
-        if category_path and category_path.exists():
-            all_files = list(category_path.glob('*'))
-            logger.info(f"Found {len(all_files)} files")
-            for file_path in all_files:
-                if file_path.suffix in SUPPORTED_EXTENSIONS:
-                    logger.info(f"Processing file: {file_path}")
-                    try:
-                        self.populate_file_item(file_path, selected_group, selected_sources)
-                    except Exception as e:
-                        logger.error(f"Error processing file {file_path}: {str(e)}")
+        rows = set(range(len(self.file_rows['path'])))
+        if selected_sources:
+            rows &= set().union(*(self.file_index['source'].get(source, ()) for source in selected_sources))
+
+        group_field = GROUP_FIELDS.get(selected_group)
+        if group_field:
+            groups = {value: rows & members for value, members in self.file_index[group_field].items()}
+        else:
+            groups = {"All": rows}
 
-        # Sort the groups
-        for group_item in self.file_groups.values():
-            group_item.sortChildren(0, QtCore.Qt.AscendingOrder)
+        with bulk_update(self.file_list_widget):
+            self.file_list_widget.clear()
+            self.file_groups = {}  # Reset file_groups here
+            self.file_items_by_path = {}
 
-        # Expand all groups
-        self.file_list_widget.expandAll()
+            # Groups are filled and sorted while detached, then inserted into the tree in one call
+            for group_key, members in groups.items():
+                if not members:
+                    continue
+                group_item = QtWidgets.QTreeWidgetItem([group_key])
+                group_item.setFlags(group_item.flags() & ~Qt.ItemIsSelectable)
+                group_item.addChildren([self.build_file_row(row) for row in members])
+                group_item.sortChildren(0, QtCore.Qt.AscendingOrder)
+                self.file_groups[group_key] = group_item
+            self.file_list_widget.addTopLevelItems(list(self.file_groups.values()))
 
-        # Restore the previous selection if possible
-        if current_file_path:
-            items = self.file_list_widget.findItems(Path(current_file_path).stem, QtCore.Qt.MatchContains | QtCore.Qt.MatchRecursive)
-            if items:
-                self.file_list_widget.setCurrentItem(items[0])
-                self.file_list_widget.scrollToItem(items[0])
+            # Expand all groups
+            self.file_list_widget.expandAll()
+
+        # The rebuilt items are all visible again, so re-apply the search text
+        self.last_filter_text = None
+        if self.filter_line_edit.text():
+            self.filter_files()
+
+        self.scan_preview_dirs()
+
+        # Restore the previous selection if possible; signals are live again so the preview follows
+        file_item = self.file_items_by_path.get(current_file_path) if current_file_path else None
+        if file_item:
+            self.file_list_widget.setCurrentItem(file_item)
+            self.file_list_widget.scrollToItem(file_item)
+        elif current_file_path:
+            self.on_selection_changed()
 
         logger.info(f"Finished updating file list for user {selected_user}")
         logger.info(f"Total top-level items: {self.file_list_widget.topLevelItemCount()}")
@@ -1352,13 +1794,20 @@ class MyShelfToolUI(QtWidgets.QWidget):
             top_level_item = self.file_list_widget.topLevelItem(i)
             logger.info(f"Top-level item {i}: {top_level_item.text(0)}, Child count: {top_level_item.childCount()}")
 
-    @staticmethod
-    def camel_case_to_words(name: str) -> str:
-        pattern = re.compile(r'(?<!^)(?=[A-Z])')
-        words = pattern.sub(' ', name).split()
-        return ' '.join(word.capitalize() for word in words)
+    # Bound straight to the memoised helper: scan_file_rows calls this once per row
+    camel_case_to_words = staticmethod(_camel_case_to_words)
 
-    def populate_file_item(self, file_path, selected_group, selected_sources):
+    @staticmethod
+    def get_group_key(context: str, file_type: str, source: str, selected_group: Optional[str]) -> str:
+        if selected_group == "Type":
+            return file_type
+        elif selected_group == "Context":
+            return context
+        elif selected_group == "Source":
+            return source
+        return "All"
+
+    def populate_file_item(self, file_path, selected_group, selected_sources, stat: Optional[os.stat_result] = None):
         logger.debug(f"Populating file item: {file_path}")
         parts = file_path.stem.split('_')
         if len(parts) >= 5:
@@ -1370,14 +1819,7 @@ class MyShelfToolUI(QtWidgets.QWidget):
                 logger.info(f"Skipping file {file_path} due to source filter")
                 return  # Skip files from unselected sources
 
-            if selected_group == "Type":
-                group_key = file_type
-            elif selected_group == "Context":
-                group_key = context
-            elif selected_group == "Source":
-                group_key = source
-            else:
-                group_key = "All"
+            group_key = self.get_group_key(context, file_type, source, selected_group)
 
             if group_key not in self.file_groups:
                 logger.info(f"Creating new group: {group_key}")
@@ -1386,15 +1828,20 @@ class MyShelfToolUI(QtWidgets.QWidget):
                 self.file_list_widget.addTopLevelItem(group_item)
                 self.file_groups[group_key] = group_item
 
-            date_modified = file_path.stat().st_mtime
-            size = file_path.stat().st_size
+            # Directory scans pass the DirEntry's stat along; otherwise stat once for both columns
+            if stat is None:
+                stat = file_path.stat()
+            date_modified = stat.st_mtime
+            size = stat.st_size
 
-            date_modified_str = QtCore.QDateTime.fromSecsSinceEpoch(int(date_modified)).toString("yyyy-MM-dd hh:mm:ss")
+            date_modified_str = _format_mtime(int(date_modified))
 
-            file_item = QtWidgets.QTreeWidgetItem([context, file_type, display_name, source, version, date_modified_str, f"{size / 1024:.2f} KB"])
-            file_item.setData(0, QtCore.Qt.UserRole, str(file_path))
+            texts = [context, file_type, display_name, source, version, date_modified_str, f"{size / 1024:.2f} KB"]
+            file_item = QtWidgets.QTreeWidgetItem(texts)
+            file_item.setData(0, QtCore.Qt.UserRole, ItemMeta(str(file_path), texts))
             file_item.setFlags(file_item.flags() | QtCore.Qt.ItemIsEditable)
             self.file_groups[group_key].addChild(file_item)
+            self.file_items_by_path[str(file_path)] = file_item
             logger.info(f"Added file item: {display_name} to group {group_key}")
         else:
             logger.warning(f"Skipping file {file_path} due to incorrect name format")
@@ -1405,18 +1852,22 @@ class MyShelfToolUI(QtWidgets.QWidget):
             logger.warning(f"Directory {base_directory} does not exist.")
             return
 
-        all_files = [f for f in base_directory.iterdir() if f.suffix in SUPPORTED_EXTENSIONS]
+        with os.scandir(base_directory) as entries:
+            all_files = [(Path(entry.path), entry.stat()) for entry in entries
+                         if os.path.splitext(entry.name)[1] in SUPPORTED_EXTENSIONS]
 
-        file_list_widget.setHeaderLabels(["Context", "Type", "Name", "Source", "Version", "Date Modified", "Size"])
+        file_list_widget.setHeaderLabels(list(FILE_LIST_HEADERS))
         file_list_widget.setSortingEnabled(True)
 
         self.file_groups = {}
+        self.file_items_by_path = {}
 
-        for file_path in all_files:
-            self.populate_file_item(file_path, selected_group, selected_sources)
+        with bulk_update(file_list_widget):
+            for file_path, stat in all_files:
+                self.populate_file_item(file_path, selected_group, selected_sources, stat)
 
-        for group_item in self.file_groups.values():
-            group_item.setExpanded(True)
+            for group_item in self.file_groups.values():
+                group_item.setExpanded(True)
 
         for i in range(file_list_widget.columnCount()):
             file_list_widget.resizeColumnToContents(i)
@@ -1442,20 +1893,34 @@ class MyShelfToolUI(QtWidgets.QWidget):
 
         header.setSortIndicator(column, new_order)
 
+    def schedule_filter_files(self):
+        self.filter_timer.start()
+
     def filter_files(self):
         filter_text = self.filter_line_edit.text().lower()
-        
-        for i in range(self.file_list_widget.topLevelItemCount()):
-            group_item = self.file_list_widget.topLevelItem(i)
-            group_visible = False
-            
-            for j in range(group_item.childCount()):
-                file_item = group_item.child(j)
-                item_visible = any(filter_text in file_item.text(col).lower() for col in range(file_item.columnCount()))
-                file_item.setHidden(not item_visible)
-                group_visible = group_visible or item_visible
-            
-            group_item.setHidden(not group_visible)
+        if filter_text == self.last_filter_text:
+            return
+        # Typing onto the previous text can only hide more rows, so hidden ones are left alone
+        narrowing = bool(self.last_filter_text) and self.last_filter_text in filter_text
+        self.last_filter_text = filter_text
+
+        with bulk_update(self.file_list_widget):
+            for i in range(self.file_list_widget.topLevelItemCount()):
+                group_item = self.file_list_widget.topLevelItem(i)
+                if narrowing and group_item.isHidden():
+                    continue
+                group_visible = False
+
+                for j in range(group_item.childCount()):
+                    file_item = group_item.child(j)
+                    if narrowing and file_item.isHidden():
+                        continue
+                    # One substring test against the texts lowered when the row was built
+                    item_visible = filter_text in file_item.data(0, QtCore.Qt.UserRole).search_text
+                    file_item.setHidden(not item_visible)
+                    group_visible = group_visible or item_visible
+
+                group_item.setHidden(not group_visible)
 
     def update_preview(self, file_path=None):
         try:
@@ -1463,26 +1928,31 @@ class MyShelfToolUI(QtWidgets.QWidget):
             current_item = self.file_list_widget.currentItem()  # Assuming 'file_list_widget' is the name of your tree widget
             if current_item and current_item.childCount() == 0:  # Ensure it's a file item, not a group
                 # Assuming the file path is stored as item data
-                file_path = current_item.data(0, Qt.UserRole)
+                file_path = current_item.data(0, Qt.UserRole).file_path
                 
                 if file_path:
-                    try:
-                        loop = asyncio.get_event_loop()
-                    except RuntimeError:
-                        # If there's no event loop, create a new one
-                        loop = asyncio.new_event_loop()
-                        asyncio.set_event_loop(loop)
-
-                    if loop.is_running():
-                        # If the loop is running, create a task
-                        self.current_task = asyncio.create_task(self._update_preview(file_path))
-                    else:
-                        # If the loop isn't running, run the coroutine directly
-                        self.current_task = loop.run_until_complete(self._update_preview(file_path))
+                    # Only matters when an outer loop is running; otherwise run_async finished it already
+                    if isinstance(self.current_task, asyncio.Future) and not self.current_task.done():
+                        self.current_task.cancel()
+                    self.current_task = self.run_async(self._update_preview(file_path))
         except Exception as e:
             logger.error(f"Error in update_preview: {str(e)}")
             logger.error(traceback.format_exc())
 
+    def run_async(self, coro):
+        try:
+            loop = asyncio.get_event_loop()
+        except RuntimeError:
+            # If there's no event loop, create a new one
+            loop = asyncio.new_event_loop()
+            asyncio.set_event_loop(loop)
+
+        if loop.is_running():
+            # If the loop is running, create a task
+            return asyncio.ensure_future(coro)
+        # If the loop isn't running, run the coroutine directly
+        return loop.run_until_complete(coro)
+
     def get_current_file_path(self):
         # Implement this method based on how you're storing and accessing the current file path
         # For example:
@@ -1510,7 +1980,7 @@ class MyShelfToolUI(QtWidgets.QWidget):
                         logger.debug(f"First selected item child count: {selected_items[0].childCount()}")
                     if selected_items and not selected_items[0].childCount():
                         selected_item = selected_items[0]
-                        file_path = Path(selected_item.data(0, QtCore.Qt.UserRole))
+                        file_path = selected_item.data(0, QtCore.Qt.UserRole).path
                 
                 if file_path:
                     logger.debug(f"Selected file: {file_path}")
@@ -1519,7 +1989,7 @@ class MyShelfToolUI(QtWidgets.QWidget):
                     file_path = Path(file_path)
                     
                     # Always read fresh data from json_data
-                    json_data = next((item for item in self.json_data if item['File Name'] == file_path.stem), None)
+                    json_data = self.master_index.get(file_path.stem)
                     
                     logger.debug(f"JSON data: {json_data}")
                     
@@ -1534,8 +2004,9 @@ class MyShelfToolUI(QtWidgets.QWidget):
                             self.description_edit_button.setText("Edit")
                             self.description_save_button.setEnabled(False)
                             
-                            # Use QTimer to allow UI to update
-                            QtCore.QTimer.singleShot(0, lambda: self.load_preview_assets(json_data))
+                            # Let the UI update first; a newer selection replaces this one before it loads
+                            self.pending_preview = (json_data, file_path.stem)
+                            self.update_preview_timer.start()
                         finally:
                             # Restore original logging level
                             logger.setLevel(original_level)
@@ -1562,10 +2033,37 @@ class MyShelfToolUI(QtWidgets.QWidget):
         if self.file_list_widget.currentItem():
             self.file_list_widget.scrollToItem(self.file_list_widget.currentItem())
             
-    def load_preview_assets(self, json_data):
+    def show_cached_preview(self, stem: str) -> bool:
+        preview = self.preview_cache.get(stem)
+        if preview is None:
+            return False
+        self.preview_cache.move_to_end(stem)
+        if preview['flipbook_frames']:
+            self.preview_manager.flipbook_frames = preview['flipbook_frames']
+            self.preview_manager.current_frame = 0
+            self.update_flipbook_preview(preview['flipbook_frames'])
+        else:
+            self.clear_flipbook()
+        if preview['snapshot_pixmap']:
+            self.update_snapshot_preview(preview['snapshot_pixmap'])
+        else:
+            self.clear_snapshot()
+        return True
+
+    def load_pending_preview(self):
+        if self.pending_preview is not None:
+            json_data, file_stem = self.pending_preview
+            self.pending_preview = None
+            self.load_preview_assets(json_data, file_stem)
+
+    def load_preview_assets(self, json_data, file_stem: str):
         # Remove the asyncio.create_task call and handle it synchronously
         try:
-            logger.debug(f"Loading preview assets for: {json_data.get('File Name', 'Unknown')}")
+            logger.debug(f"Loading preview assets for: {file_stem}")
+            if self.show_cached_preview(file_stem) or self.adopt_preload(file_stem):
+                return
+            # Queued neighbour preloads would sit ahead of this load's frame chunks in the pool
+            self.cancel_queued_preloads()
             flipbook_path = json_data.get('Flipbook', '')
             snapshot_path = json_data.get('Snap', '')
             
@@ -1577,28 +2075,25 @@ class MyShelfToolUI(QtWidgets.QWidget):
 
             if flipbook_path:
                 filename = Path(flipbook_path).stem.split('.')[0]
-                full_flipbook_path = self.file_manager.get_preview_base_path(self.user_combo.currentText()) / 'flipbook' / filename / f"{filename}.$F4.png"
+                full_flipbook_path = self._preview_paths()['flipbook'] / filename / f"{filename}.$F4.png"
                 logger.debug(f"Full flipbook path: {full_flipbook_path}")
-                if full_flipbook_path.parent.exists():
+                if self.preview_exists(filename, 'flipbook', full_flipbook_path.parent):
                     flipbook_frames = self.preview_manager.load_flipbook(str(full_flipbook_path))
                     self.update_flipbook_preview(flipbook_frames)
                 else:
                     logger.warning(f"Flipbook directory does not exist: {full_flipbook_path.parent}")
 
             if snapshot_path:
-                full_snapshot_path = self.file_manager.get_preview_base_path(self.user_combo.currentText()) / 'snapshot' / Path(snapshot_path).name
+                full_snapshot_path = self._preview_paths()['snapshot'] / Path(snapshot_path).name
                 logger.debug(f"Full snapshot path: {full_snapshot_path}")
-                snapshot_pixmap = self.preview_manager.load_snapshot(str(full_snapshot_path))
+                if self.preview_exists(full_snapshot_path.stem, 'snapshot', full_snapshot_path):
+                    snapshot_pixmap = self.preview_manager.load_snapshot(str(full_snapshot_path))
                 if snapshot_pixmap:
                     self.update_snapshot_preview(snapshot_pixmap)
                 else:
                     logger.warning(f"Failed to load snapshot: {full_snapshot_path}")
 
-            self.preview_cache[json_data['File Name']] = {
-                'json_data': json_data,
-                'flipbook_frames': flipbook_frames,
-                'snapshot_pixmap': snapshot_pixmap
-            }
+            self.cache_preview(file_stem, json_data, flipbook_frames, snapshot_pixmap)
         except Exception as e:
             logger.error(f"Error loading preview assets: {e}")
         finally:
@@ -1606,48 +2101,6 @@ class MyShelfToolUI(QtWidgets.QWidget):
             QtCore.QTimer.singleShot(0, self.file_list_widget.setFocus)
 
 
-    async def load_preview_assets_async(self, json_data: Dict):
-        try:
-            logger.debug(f"Loading preview assets for: {json_data.get('File Name', 'Unknown')}")
-            flipbook_path = json_data.get('Flipbook', '')
-            snapshot_path = json_data.get('Snap', '')
-            
-            logger.debug(f"Flipbook path: {flipbook_path}")
-            logger.debug(f"Snapshot path: {snapshot_path}")
-
-            flipbook_frames = []
-            snapshot_pixmap = None
-
-            if flipbook_path:
-                filename = Path(flipbook_path).stem.split('.')[0]
-                full_flipbook_path = self.file_manager.get_preview_base_path(self.user_combo.currentText()) / 'flipbook' / filename / f"{filename}.$F4.png"
-                logger.debug(f"Full flipbook path: {full_flipbook_path}")
-                if full_flipbook_path.parent.exists():
-                    flipbook_frames = await self.load_flipbook_async(str(full_flipbook_path))
-                    self.update_flipbook_preview(flipbook_frames)
-                else:
-                    logger.warning(f"Flipbook directory does not exist: {full_flipbook_path.parent}")
-
-            if snapshot_path:
-                full_snapshot_path = self.file_manager.get_preview_base_path(self.user_combo.currentText()) / 'snapshot' / Path(snapshot_path).name
-                logger.debug(f"Full snapshot path: {full_snapshot_path}")
-                snapshot_pixmap = await self.load_snapshot_async(str(full_snapshot_path))
-                if snapshot_pixmap:
-                    self.update_snapshot_preview(snapshot_pixmap)
-                else:
-                    logger.warning(f"Failed to load snapshot: {full_snapshot_path}")
-
-            self.preview_cache[json_data['File Name']] = {
-                'json_data': json_data,
-                'flipbook_frames': flipbook_frames,
-                'snapshot_pixmap': snapshot_pixmap
-            }
-        except Exception as e:
-            logger.error(f"Error loading preview assets: {e}")
-        finally:
-            # Ensure focus returns to the file list widget
-            QtCore.QTimer.singleShot(0, self.file_list_widget.setFocus)
-
     def update_preview_widgets(self, flipbook_frames, snapshot_pixmap):
         if flipbook_frames:
             self.preview_manager.flipbook_frames = flipbook_frames
@@ -1659,39 +2112,28 @@ class MyShelfToolUI(QtWidgets.QWidget):
 
         if snapshot_pixmap:
             self.snapshot_preview.setPixmap(snapshot_pixmap)
+            self.snapshot_scaled_key = None  # shown as-is, not scaled from snapshot_source_pixmap
             self.snapshot_preview.setFixedSize(snapshot_pixmap.size())
             self.snapshot_save_button.setEnabled(True)
             self.current_snapshot_path = str(snapshot_pixmap.fileName())
         else:
             self.clear_snapshot()
 
-    async def load_flipbook_async(self, flipbook_path: str) -> List[QtGui.QPixmap]:
-        loop = asyncio.get_event_loop()
-        try:
-            return await loop.run_in_executor(self.thread_pool, self.preview_manager.load_flipbook, flipbook_path)
-        except Exception as e:
-            logger.error(f"Error loading flipbook: {e}")
-            return []
-
-    async def load_snapshot_async(self, snapshot_path: str) -> Optional[QtGui.QPixmap]:
-        loop = asyncio.get_event_loop()
-        return await loop.run_in_executor(self.thread_pool, self.preview_manager.load_snapshot, snapshot_path)
-
     def format_preview_text(self, json_data: Dict):
         description = json_data.get('Summary', 'No description available.')
         logger.debug(f"Description content: {description}")
         self.description_widget.setPlainText(description)
         self.description_widget.repaint()
 
-    def format_preview_text(self, json_data: Dict):
-        description = json_data.get('Summary', 'No description available.')
-        logger.debug(f"Description content: {description}")
-        self.description_widget.setPlainText(description)
-        self.description_widget.repaint()
+    def load_json_data(self, while_parsing=None):
+        # Persist pending in-memory edits before re-reading from disk
+        self.flush_master_json()
 
-    def load_json_data(self):
-        user = self.user_combo.currentText()
-        master_json_path = Path(self.base_path) / 'pyDump' / user / 'Snips' / 'descriptions' / 'master.json'
+        user = self._user
+        master_json_path = _master_path_for(self.base_path, user)
+        self.master_json_path = master_json_path
+        mtime_ns = None
+        future = None
         
         try:
             # Create directory structure if it doesn't exist
@@ -1699,23 +2141,90 @@ class MyShelfToolUI(QtWidgets.QWidget):
             
             # Create empty master.json if it doesn't exist
             if not master_json_path.exists():
-                with master_json_path.open('w') as f:
-                    json.dump([], f)
-            
-            with master_json_path.open('r') as f:
-                self.json_data = json.load(f)
-                
-            if not isinstance(self.json_data, list):
-                logger.warning("JSON data is not a list, initializing empty list")
-                self.json_data = []
-                
-            logger.info(f"Loaded JSON data for user {user}: {len(self.json_data)} entries")
+                write_master_json(master_json_path, [])
+
+            # Skip the parse when the file is unchanged since we last read or wrote it
+            mtime_ns = master_json_path.stat().st_mtime_ns
+            cached = self.master_cache.get(master_json_path)
+            if cached is not None and cached[0] == mtime_ns:
+                _, self.json_data, self.master_index = cached
+                self.master_disk_stems = set(self.master_index)
+                logger.debug(f"Reusing parsed JSON data for user {user}")
+            else:
+                future = self.thread_pool.submit(read_master_json, master_json_path)
         except Exception as e:
             logger.error(f"Failed to load JSON data: {e}")
             self.json_data = []
+            mtime_ns = None
+
+        # while_parsing runs on the GUI thread while the pool parses the file. It is
+        # guarded on its own: its failure must never discard a successful parse
+        if while_parsing is not None:
+            try:
+                while_parsing()
+            except Exception as e:
+                logger.error(f"Error running alongside the master.json parse for user {user}: {e}")
+
+        if future is None:
+            if mtime_ns is not None:  # Served from master_cache
+                return
+        else:
+            try:
+                self.json_data = future.result()
+
+                if not isinstance(self.json_data, list):
+                    logger.warning("JSON data is not a list, initializing empty list")
+                    self.json_data = []
+
+                logger.info(f"Loaded JSON data for user {user}: {len(self.json_data)} entries")
+            except Exception as e:
+                logger.error(f"Failed to load JSON data: {e}")
+                self.json_data = []
+                mtime_ns = None
+
+        self.master_index = {entry.get('File Name'): entry for entry in self.json_data}
+        self.master_disk_stems = set(self.master_index)
+        if mtime_ns is not None:
+            self.master_cache[master_json_path] = (mtime_ns, self.json_data, self.master_index)
+
+    def get_master_entry(self, stem: str, create: bool = False) -> Optional[Dict]:
+        entry = self.master_index.get(stem)
+        if entry is None and create:
+            entry = {"File Name": stem}
+            self.json_data.append(entry)
+            self.master_index[stem] = entry
+        return entry
+
+    def remove_master_entry(self, stem: str) -> bool:
+        entry = self.master_index.pop(stem, None)
+        if entry is None:
+            return False
+        self.json_data.remove(entry)
+        self.mark_master_dirty()
+        return True
+
+    def mark_master_dirty(self):
+        self.master_dirty = True
+        self.master_flush_timer.start(MASTER_FLUSH_DELAY_MS)
+
+    def flush_master_json(self):
+        with self.master_lock:
+            self.master_flush_timer.stop()
+            if not self.master_dirty or self.master_json_path is None:
+                return
+            try:
+                write_master_json(self.master_json_path, self.json_data)
+                self.master_dirty = False
+                self.master_disk_stems = set(self.master_index)
+                # Our own write must not look like an outside change
+                self.master_cache[self.master_json_path] = (
+                    self.master_json_path.stat().st_mtime_ns, self.json_data, self.master_index)
+                logger.debug(f"Flushed master.json: {self.master_json_path}")
+            except Exception as e:
+                logger.error(f"Error writing master.json: {e}")
 
     def read_json_data(self, file_name: str) -> Optional[Dict]:
-        return next((item for item in self.json_data if item['File Name'] == file_name), None)
+        return self.master_index.get(file_name)
 
     def start_flipbook_animation(self):
         if self.preview_manager.flipbook_frames:
@@ -1729,6 +2238,8 @@ class MyShelfToolUI(QtWidgets.QWidget):
         self.clear_preview_assets()
 
     def clear_preview_assets(self):
+        self.update_preview_timer.stop()
+        self.pending_preview = None
         self.clear_flipbook()
         self.clear_snapshot()
 
@@ -1748,6 +2259,8 @@ class MyShelfToolUI(QtWidgets.QWidget):
         self.snapshot_preview.setFixedSize(MAX_PREVIEW_SIZE)
         self.snapshot_save_button.setEnabled(True)
         self.current_snapshot_path = None
+        self.snapshot_source_pixmap = None
+        self.snapshot_scaled_key = None
 
 
     def update_flipbook_frame(self):
@@ -1782,9 +2295,8 @@ class MyShelfToolUI(QtWidgets.QWidget):
             return
 
         selected_item = selected_items[0]
-        file_path = Path(selected_item.data(0, QtCore.Qt.UserRole))
-        user = self.user_combo.currentText()
-        full_path = self.base_path / 'pyDump' / user / 'Snips' / file_path.name
+        file_path = selected_item.data(0, QtCore.Qt.UserRole).path
+        full_path = self._preview_paths()['snips'] / file_path.name
 
         if not full_path.exists():
             self.show_error_dialog("File Not Found", f"The file {file_path.name} does not exist.")
@@ -1840,7 +2352,7 @@ class MyShelfToolUI(QtWidgets.QWidget):
         return label
 
     def update_ui_for_new_user(self):
-        selected_user = self.user_combo.currentText()
+        selected_user = self._user
         if not self.json_data:
             message = f"No data found for user: {selected_user}. Please check if the master.json file exists."
             self.description_widget.setPlainText(message)
@@ -1853,7 +2365,8 @@ class MyShelfToolUI(QtWidgets.QWidget):
             return
 
         selected_item = selected_items[0]
-        file_path = Path(selected_item.data(0, QtCore.Qt.UserRole))
+        file_path = selected_item.data(0, QtCore.Qt.UserRole).path
+        stem = file_path.stem
 
         reply = self.show_question_dialog("Confirm Deletion", 
                                           f"Are you sure you want to delete {file_path.name}?",
@@ -1862,74 +2375,48 @@ class MyShelfToolUI(QtWidgets.QWidget):
         
         if reply == QtWidgets.QMessageBox.Yes:
             try:
-                user = self.user_combo.currentText()
-                
                 # Delete the main file
-                if file_path.exists():
+                try:
                     file_path.unlink()
                     logger.info(f"Deleted file: {file_path}")
-                else:
+                except FileNotFoundError:
                     logger.warning(f"File not found: {file_path}")
 
                 # Delete associated flipbook directory
-                flipbook_dir = self.base_path / 'pyDump' / user / 'Snips' / 'preview' / 'flipbook' / file_path.stem
-                if flipbook_dir.exists():
-                    shutil.rmtree(flipbook_dir)
+                flipbook_dir = self._preview_paths()['flipbook'] / stem
+                try:
+                    _remove_flipbook_dir(flipbook_dir)
                     logger.info(f"Deleted flipbook directory: {flipbook_dir}")
-                else:
+                except FileNotFoundError:
                     logger.warning(f"Flipbook directory not found: {flipbook_dir}")
 
                 # Delete associated snapshot
-                snapshot_path = self.base_path / 'pyDump' / user / 'Snips' / 'preview' / 'snapshot' / f"{file_path.stem}.png"
-                if snapshot_path.exists():
+                snapshot_path = self._preview_paths()['snapshot'] / f"{stem}.png"
+                try:
                     snapshot_path.unlink()
                     logger.info(f"Deleted snapshot: {snapshot_path}")
-                else:
+                except FileNotFoundError:
                     logger.warning(f"Snapshot not found: {snapshot_path}")
 
                 # Remove entry from master.json
-                master_json_path = self.base_path / 'pyDump' / user / 'Snips' / 'descriptions' / 'master.json'
-                if master_json_path.exists():
-                    with master_json_path.open('r') as f:
-                        master_data = json.load(f)
-                    
-                    master_data = [entry for entry in master_data if entry['File Name'] != file_path.stem]
-                    
-                    with master_json_path.open('w') as f:
-                        json.dump(master_data, f, indent=4)
-                    
-                    logger.info(f"Updated master.json: removed entry for {file_path.stem}")
-                else:
-                    logger.warning(f"master.json not found: {master_json_path}")
-
-                # Remove item from the tree widget
-                parent = selected_item.parent()
-                if parent:
-                    parent.removeChild(selected_item)
-                else:
-                    index = self.file_list_widget.indexOfTopLevelItem(selected_item)
-                    self.file_list_widget.takeTopLevelItem(index)
+                if self.remove_master_entry(stem):
+                    logger.info(f"Updated master.json: removed entry for {stem}")
 
                 # Clear the caches
-                self.json_cache.pop(file_path.stem, None)
-                self.preview_cache.pop(file_path.stem, None)
-
-                # Update local json_data
-                self.json_data = [entry for entry in self.json_data if entry['File Name'] != file_path.stem]
+                self.invalidate_cache(stem)
 
+                self._remove_item_in_place(selected_item)
                 self.show_info_dialog("File Deleted", f"{file_path.name} and its associated files have been deleted.")
                 
-                # Refresh the UI
-                self.refresh_ui()
-                
             except Exception as e:
-                logger.error(f"Error deleting file: {e}", exc_info=True)
+                logger.error(f"Error deleting file: {e}", exc_info=logger.isEnabledFor(logging.DEBUG))
                 self.show_error_dialog("Deletion Failed", f"Failed to delete file: {e}")
         else:
             self.show_info_dialog("Deletion Cancelled", "The file was not deleted.")
 
     def delete_file(self, item: QtWidgets.QTreeWidgetItem):
-        file_path = Path(item.data(0, QtCore.Qt.UserRole))
+        file_path = item.data(0, QtCore.Qt.UserRole).path
+        stem = file_path.stem
         reply = self.show_question_dialog(
             'Confirm Delete',
             f"Are you sure you want to delete '{file_path.name}' and all associated data?",
@@ -1938,67 +2425,51 @@ class MyShelfToolUI(QtWidgets.QWidget):
         )
         if reply == QtWidgets.QMessageBox.Yes:
             try:
-                user = self.user_combo.currentText()
-                
                 # Construct correct paths
-                uti_file_path = self.base_path / 'pyDump' / user / 'Snips' / file_path.name
-                master_json_path = self.base_path / 'pyDump' / user / 'Snips' / 'descriptions' / 'master.json'
-                flipbook_dir_path = self.base_path / 'pyDump' / user / 'Snips' / 'preview' / 'flipbook' / file_path.stem
-                snapshot_path = self.base_path / 'pyDump' / user / 'Snips' / 'preview' / 'snapshot' / f"{file_path.stem}.png"
+                uti_file_path = self._preview_paths()['snips'] / file_path.name
+                flipbook_dir_path = self._preview_paths()['flipbook'] / stem
+                snapshot_path = self._preview_paths()['snapshot'] / f"{stem}.png"
 
                 # Delete the .uti file
-                if uti_file_path.exists():
+                try:
                     uti_file_path.unlink()
                     logger.info(f"Deleted .uti file: {uti_file_path}")
-                else:
+                except FileNotFoundError:
                     logger.warning(f".uti file not found: {uti_file_path}")
 
                 # Delete flipbook directory
-                if flipbook_dir_path.exists():
-                    shutil.rmtree(flipbook_dir_path)
+                try:
+                    _remove_flipbook_dir(flipbook_dir_path)
                     logger.info(f"Deleted flipbook directory: {flipbook_dir_path}")
-                else:
+                except FileNotFoundError:
                     logger.warning(f"Flipbook directory not found: {flipbook_dir_path}")
 
                 # Delete snapshot
-                if snapshot_path.exists():
+                try:
                     snapshot_path.unlink()
                     logger.info(f"Deleted snapshot: {snapshot_path}")
-                else:
+                except FileNotFoundError:
                     logger.warning(f"Snapshot not found: {snapshot_path}")
 
                 # Update master.json
-                if master_json_path.exists():
-                    with master_json_path.open('r') as f:
-                        master_data = json.load(f)
-
-                    master_data = [entry for entry in master_data if entry['File Name'] != file_path.stem]
-
-                    with master_json_path.open('w') as f:
-                        json.dump(master_data, f, indent=4)
-                        logger.info(f"Updated master.json: {master_json_path}")
-                else:
-                    logger.warning(f"master.json not found: {master_json_path}")
+                if self.remove_master_entry(stem):
+                    logger.info(f"Updated master.json: removed entry for {stem}")
                 
                 self.show_info_dialog("File Deleted", f"Successfully deleted {file_path.name} and associated data")
                 
                 # Clear the caches
-                self.json_cache.pop(file_path.stem, None)
-                cache_keys_to_remove = [key for key in self.preview_cache if file_path.stem in key]
-                for key in cache_keys_to_remove:
-                    del self.preview_cache[key]
+                self.invalidate_cache(stem)
 
-                # Refresh the UI
-                self.refresh_ui()
+                self._remove_item_in_place(item)
             except Exception as e:
                 self.show_error_dialog("Deletion Failed", f"Failed to delete file and associated data: {e}")
-                logger.error(f"Error deleting file and associated data: {e}", exc_info=True)
+                logger.error(f"Error deleting file and associated data: {e}", exc_info=logger.isEnabledFor(logging.DEBUG))
 
     def refresh_ui(self):
         logger.debug("Refresh UI called")
         try:
             current_item = self.file_list_widget.currentItem()
-            current_file_path = current_item.data(0, QtCore.Qt.UserRole) if current_item else None
+            current_file_path = _item_file_path(current_item)
 
             self.load_json_data()
             self.update_file_list()
@@ -2010,31 +2481,17 @@ class MyShelfToolUI(QtWidgets.QWidget):
             else:
                 self.clear_preview()
         except Exception as e:
-            logger.error(f"Error refreshing UI: {e}", exc_info=True)
+            logger.error(f"Error refreshing UI: {e}", exc_info=logger.isEnabledFor(logging.DEBUG))
             self.show_error_dialog("Refresh Failed", f"Failed to refresh UI: {e}")
 
-    def reselect_file(self, file_path: Path):
-        for i in range(self.file_list_widget.topLevelItemCount()):
-            group_item = self.file_list_widget.topLevelItem(i)
-            for j in range(group_item.childCount()):
-                file_item = group_item.child(j)
-                if Path(file_item.data(0, QtCore.Qt.UserRole)) == file_path:
-                    self.file_list_widget.setCurrentItem(file_item)
-                    self.update_preview()
-                return
-        logger.warning(f"Could not find item to reselect: {file_path}")
-        self.clear_preview()
-
     def populate_source_filter(self):
         self.source_filter_combo.clear()
-        sources = set()
-        category_path = self.base_path / 'pyDump' / self.user_combo.currentText() / 'Snips'
-        if category_path.exists():
-            for file_path in category_path.glob('*'):
-                parts = file_path.stem.split('_')
-                if len(parts) >= 5:
-                    sources.add(parts[-2])  # Assuming source is the second-to-last part
-        
+        # The source index from the file list scan already holds every source
+        if self.file_rows_user != self._user:
+            self.scan_file_rows(self._preview_paths()['snips'])
+            self.file_rows_user = self._user
+        sources = set(self.file_index['source'])
+
         model = self.source_filter_combo.model()
         model.clear()
         saved_sources = self.settings.value("selected_sources", [])
@@ -2057,23 +2514,27 @@ class MyShelfToolUI(QtWidgets.QWidget):
 
     def on_source_filter_changed(self):
         self.update_source_filter_text()
-        self.update_file_list()
+        self.update_file_list(rescan=False)
 
     def get_selected_sources(self):
         model = self.source_filter_combo.model()
         return [model.item(i).text() for i in range(model.rowCount()) if model.item(i).checkState() == QtCore.Qt.Checked]
 
     def save_settings(self):
-        self.settings.setValue("geometry", self.saveGeometry())
-        self.settings.setValue("user_filter_enabled", self.user_checkbox.isChecked())
-        self.settings.setValue("selected_user", self.user_combo.currentText())
-        self.settings.setValue("group_filter_enabled", self.group_checkbox.isChecked())
-        self.settings.setValue("selected_group", self.group_combo.currentText())
-        self.settings.setValue("source_filter_enabled", self.source_checkbox.isChecked())
-        self.settings.setValue("selected_sources", self.get_selected_sources())
-        self.settings.setValue("filter_text", self.filter_line_edit.text())
-        self.settings.setValue("preview_visible", self.toggle_preview_checkbox.isChecked())
-        self.settings.setValue("show_dialogs", self.show_dialogs_checkbox.isChecked())
+        values = {
+            "geometry": self.saveGeometry(),
+            "user_filter_enabled": self.user_checkbox.isChecked(),
+            "selected_user": self._user,
+            "group_filter_enabled": self.group_checkbox.isChecked(),
+            "selected_group": self.group_combo.currentText(),
+            "source_filter_enabled": self.source_checkbox.isChecked(),
+            "selected_sources": self.get_selected_sources(),
+            "filter_text": self.filter_line_edit.text(),
+            "preview_visible": self.toggle_preview_checkbox.isChecked(),
+            "show_dialogs": self.show_dialogs_checkbox.isChecked(),
+        }
+        # Widgets are read here on the GUI thread; the QSettings sync runs on the pool so closing doesn't wait on disk
+        self.thread_pool.submit(_write_settings, self.settings.organizationName(), self.settings.applicationName(), values)
 
     def load_settings(self):
         # Restore window geometry
@@ -2123,31 +2584,35 @@ class MyShelfToolUI(QtWidgets.QWidget):
 
 
     def update_file_list_without_progress(self):
-        selected_user = self.user_combo.currentText() if self.user_checkbox.isChecked() else None
+        selected_user = self._user if self.user_checkbox.isChecked() else None
         selected_group = self.group_combo.currentText() if self.group_checkbox.isChecked() else None
         selected_sources = self.get_selected_sources() if self.source_checkbox.isChecked() else None
 
-        self.file_list_widget.clear()
+        with bulk_update(self.file_list_widget):
+            self.file_list_widget.clear()
+            self.file_groups = {}
+            self.file_items_by_path = {}
 
-        category_path = self.base_path / 'pyDump' / selected_user / 'Snips' if selected_user else None
-        if category_path and category_path.exists():
-            for file_path in category_path.glob('*'):
-                if file_path.suffix in SUPPORTED_EXTENSIONS:
-                    self.populate_file_item(file_path, selected_group, selected_sources)
+            category_path = self._preview_paths()['snips'] if selected_user else None
+            if category_path and category_path.exists():
+                with os.scandir(category_path) as entries:
+                    for entry in entries:
+                        if os.path.splitext(entry.name)[1] in SUPPORTED_EXTENSIONS:
+                            self.populate_file_item(Path(entry.path), selected_group, selected_sources, entry.stat())
 
         logger.info(f"Updated file list for user {selected_user}")
 
     def on_user_filter_toggled(self, state):
         self.user_combo.setEnabled(state == QtCore.Qt.Checked)
-        self.update_file_list()
+        self.update_file_list(rescan=False)
 
     def on_group_filter_toggled(self, state):
         self.group_combo.setEnabled(state == QtCore.Qt.Checked)
-        self.update_file_list()
+        self.update_file_list(rescan=False)
 
     def on_source_filter_toggled(self, state):
         self.source_filter_combo.setEnabled(state == QtCore.Qt.Checked)
-        self.update_file_list()
+        self.update_file_list(rescan=False)
 
     def toggle_edit_mode(self):
         logging.debug("Toggle edit mode called")
@@ -2183,39 +2648,12 @@ class MyShelfToolUI(QtWidgets.QWidget):
                 return
 
             selected_item = selected_items[0]
-            file_path = Path(selected_item.data(0, QtCore.Qt.UserRole))
+            file_path = selected_item.data(0, QtCore.Qt.UserRole).path
+            stem = file_path.stem
             new_description = self.description_widget.toPlainText()
 
-            user = self.user_combo.currentText()
-            master_json_path = self.base_path / 'pyDump' / user / 'Snips' / 'descriptions' / 'master.json'
-
-            with master_json_path.open('r') as f:
-                master_data = json.load(f)
-
-            updated = False
-            for entry in master_data:
-                if entry['File Name'] == file_path.stem:
-                    entry['Summary'] = new_description
-                    updated = True
-                    break
-
-            if not updated:
-                new_entry = {
-                    "File Name": file_path.stem,
-                    "Summary": new_description,
-                }
-                master_data.append(new_entry)
-
-            with master_json_path.open('w') as f:
-                json.dump(master_data, f, indent=4)
-
-            # Update the local json_data cache
-            for entry in self.json_data:
-                if entry['File Name'] == file_path.stem:
-                    entry['Summary'] = new_description
-                    break
-            else:
-                self.json_data.append(new_entry)
+            self.get_master_entry(stem, create=True)['Summary'] = new_description
+            self.mark_master_dirty()
 
             # Update the description widget
             self.description_widget.setPlainText(new_description)
@@ -2223,14 +2661,14 @@ class MyShelfToolUI(QtWidgets.QWidget):
             self.description_edit_button.setText("Edit")
             self.description_save_button.setEnabled(False)
 
-            # Clear the json_cache for this item to ensure fresh data on next load
-            self.json_cache.pop(file_path.stem, None)
+            # Clear the cached entries for this item to ensure fresh data on next load
+            self.invalidate_cache(stem)
 
             self.show_info_dialog("Description Saved", "The description has been successfully updated.")
-            logger.info(f"Description updated for {file_path.stem}")
+            logger.info(f"Description updated for {stem}")
 
         except Exception as e:
-            logger.error(f"Error saving description: {e}", exc_info=True)
+            logger.error(f"Error saving description: {e}", exc_info=logger.isEnabledFor(logging.DEBUG))
             self.show_error_dialog("Save Failed", f"Failed to save description: {e}")
 
         finally:
@@ -2241,27 +2679,6 @@ class MyShelfToolUI(QtWidgets.QWidget):
         self.refresh_ui()
         self.reselect_file(file_path)
 
-    def reselect_file(self, file_path: Path):
-        for i in range(self.file_list_widget.topLevelItemCount()):
-            group_item = self.file_list_widget.topLevelItem(i)
-            for j in range(group_item.childCount()):
-                file_item = group_item.child(j)
-                if Path(file_item.data(0, QtCore.Qt.UserRole)) == file_path:
-                    self.file_list_widget.setCurrentItem(file_item)
-                    self.update_preview()
-                    return
-        logger.warning(f"Could not find item to reselect: {file_path}")
-        self.clear_preview()
-
-    def open_write_snip_ui(self):
-        logger.debug("Opening WriteSnipUI")
-        try:
-            from .write_snip_ui import create_write_snip_ui
-            create_write_snip_ui(callback=self.update_file_list)
-        except Exception as e:
-            logger.error(f"Error opening WriteSnipUI: {str(e)}")
-            self.show_error_dialog(f"Error opening New Snip UI: {str(e)}", severity=hou.severityType.Error)
-
     def edit_flipbook(self):
         logger.debug("Upload Seq button clicked")
         try:
@@ -2271,10 +2688,11 @@ class MyShelfToolUI(QtWidgets.QWidget):
                 return
 
             selected_item = selected_items[0]
-            file_path = Path(selected_item.data(0, QtCore.Qt.UserRole))
+            file_path = selected_item.data(0, QtCore.Qt.UserRole).path
+            stem = file_path.stem
 
             new_flipbook_dir = QtWidgets.QFileDialog.getExistingDirectory(
-                self, "Select New Flipbook Directory", str(self.file_manager.get_preview_base_path(self.user_combo.currentText()))
+                self, "Select New Flipbook Directory", str(self._preview_paths()['base'])
             )
 
             if not new_flipbook_dir:
@@ -2283,45 +2701,44 @@ class MyShelfToolUI(QtWidgets.QWidget):
 
             new_flipbook_path = Path(new_flipbook_dir)
 
-            if not new_flipbook_path.exists() or not any(new_flipbook_path.glob('*.png')):
+            # One listing serves both the check and the copy; a missing directory lists nothing
+            png_files = [f for f in _scan_images(new_flipbook_path) if f.suffix == '.png']
+            if not png_files:
                 self.show_warning_dialog("Invalid Directory", "Selected directory does not contain PNG files.")
                 return
 
-            dest_flipbook_folder = self.file_manager.get_preview_base_path(self.user_combo.currentText()) / 'flipbook' / file_path.stem
+            dest_flipbook_folder = self._preview_paths()['flipbook'] / stem
 
             
             try:
                 if dest_flipbook_folder.exists():
-                    shutil.rmtree(dest_flipbook_folder)
+                    _remove_flipbook_dir(dest_flipbook_folder)
                     logger.info(f"Deleted existing flipbook folder: {dest_flipbook_folder}")
 
                 dest_flipbook_folder.mkdir(parents=True, exist_ok=True)
 
                 # Rename and copy the image sequence
-                png_files = sorted(new_flipbook_path.glob('*.png'))
-                for i, png_file in enumerate(png_files):
-                    new_name = f"{file_path.stem}.{i:04d}.png"
-                    shutil.copy(png_file, dest_flipbook_folder / new_name)
+                dest_files = [dest_flipbook_folder / f"{stem}.{i:04d}.png" for i in range(len(png_files))]
+                # Copies are I/O bound, so overlap them on the thread pool; copyfile skips the mode copy
+                list(self.thread_pool.map(shutil.copyfile, png_files, dest_files))
 
                 logger.info(f"Copied and renamed new flipbook images to: {dest_flipbook_folder}")
 
                 # Update master.json with the correct path format
-                self.update_flipbook_path_in_json(file_path.stem, f"{file_path.stem}.$F4.png")
+                self.update_flipbook_path_in_json(stem, f"{stem}.$F4.png")
 
                 # Clear the cache for this file
-                cache_keys_to_remove = [key for key in self.preview_cache if file_path.stem in key]
-                for key in cache_keys_to_remove:
-                    del self.preview_cache[key]
+                self.invalidate_cache(stem)
 
                 # Refresh the UI and reselect the item
                 self.refresh_ui()
                 self.reselect_file(file_path)
 
             except Exception as e:
-                logger.error(f"Error updating flipbook: {e}", exc_info=True)
+                logger.error(f"Error updating flipbook: {e}", exc_info=logger.isEnabledFor(logging.DEBUG))
                 self.show_error_dialog("Flipbook Update Failed", f"Failed to update flipbook: {e}")
         except Exception as e:
-            logger.error(f"Error updating flipbook: {e}", exc_info=True)
+            logger.error(f"Error updating flipbook: {e}", exc_info=logger.isEnabledFor(logging.DEBUG))
             self.show_error_dialog("Flipbook Update Failed", f"Failed to update flipbook: {e}")
 
     def edit_snapshot(self):
@@ -2333,10 +2750,10 @@ class MyShelfToolUI(QtWidgets.QWidget):
                 return
 
             selected_item = selected_items[0]
-            file_path = Path(selected_item.data(0, QtCore.Qt.UserRole))
+            file_path = selected_item.data(0, QtCore.Qt.UserRole).path
 
             new_snapshot_path, _ = QtWidgets.QFileDialog.getOpenFileName(
-                self, "Select New Snapshot Image", str(self.file_manager.get_preview_base_path(self.user_combo.currentText()) / 'snapshot'),
+                self, "Select New Snapshot Image", str(self._preview_paths()['snapshot']),
                 "Images (*.png *.jpg *.jpeg *.bmp)"
             )
 
@@ -2350,7 +2767,7 @@ class MyShelfToolUI(QtWidgets.QWidget):
                 self.show_warning_dialog("Invalid Image", "Selected file is not a valid image.")
                 return
 
-            dest_snapshot_path = self.file_manager.get_preview_base_path(self.user_combo.currentText()) / 'snapshot' / f"{file_path.stem}.png"
+            dest_snapshot_path = self._preview_paths()['snapshot'] / f"{file_path.stem}.png"
 
             try:
                 if dest_snapshot_path.exists():
@@ -2358,151 +2775,94 @@ class MyShelfToolUI(QtWidgets.QWidget):
                     logger.info(f"Deleted existing snapshot: {dest_snapshot_path}")
 
                 if new_snapshot.suffix.lower() != '.png':
-                    pixmap = QPixmap(str(new_snapshot))
-                    if pixmap.isNull():
-                        raise ValueError("Failed to load the selected image.")
-                    pixmap.save(str(dest_snapshot_path), 'PNG')
-                    logger.info(f"Converted and saved new snapshot as PNG: {dest_snapshot_path}")
-                else:
-                    shutil.copy(new_snapshot, dest_snapshot_path)
-                    logger.info(f"Copied new snapshot to: {dest_snapshot_path}")
-
-                self.update_snapshot_path_in_json(file_path.stem, f"/preview/snapshot/{file_path.stem}.png")
+                    # Re-encode on a worker so large images don't block the UI;
+                    # on_snapshot_converted finishes the update on the GUI thread
+                    self.thread_pool.submit(self.convert_snapshot_to_png, new_snapshot, dest_snapshot_path, file_path)
+                    return
 
-                # Refresh the UI and reselect the item
-                self.refresh_ui()
-                self.reselect_file(file_path)
+                shutil.copy(new_snapshot, dest_snapshot_path)
+                logger.info(f"Copied new snapshot to: {dest_snapshot_path}")
+                self.on_snapshot_converted(str(file_path), "")
 
             except Exception as e:
-                logger.error(f"Error updating snapshot: {e}", exc_info=True)
+                logger.error(f"Error updating snapshot: {e}", exc_info=logger.isEnabledFor(logging.DEBUG))
                 self.show_error_dialog("Snapshot Update Failed", f"Failed to update snapshot: {e}")
         except Exception as e:
-            logger.error(f"Error updating snapshot: {e}", exc_info=True)
+            logger.error(f"Error updating snapshot: {e}", exc_info=logger.isEnabledFor(logging.DEBUG))
             self.show_error_dialog("Snapshot Update Failed", f"Failed to update snapshot: {e}")
 
-    def perform_snapshot(self, screenshot_path: Path, file_path: Path):
+    def convert_snapshot_to_png(self, source_path: Path, dest_path: Path, file_path: Path):
+        # Runs on self.thread_pool; only touches PIL and emits a queued signal
         try:
-            self.hide()
-            main_window = hou.qt.mainWindow()
-            main_window.raise_()
-            main_window.activateWindow()
-            QtCore.QTimer.singleShot(500, lambda: self.capture_screenshot(screenshot_path, file_path))
+            with Image.open(source_path) as img:
+                if img.mode not in ('RGB', 'RGBA', 'L', 'LA', 'P'):
+                    img = img.convert('RGBA')
+                img.save(dest_path, 'PNG', optimize=False)
+            logger.info(f"Converted and saved new snapshot as PNG: {dest_path}")
+            self.snapshot_converted.emit(str(file_path), "")
         except Exception as e:
-            logger.error(f"Error preparing for screenshot: {e}")
-            self.show_error_dialog("Screenshot Preparation Failed", f"Error preparing for screenshot: {e}")
-            self.show()
+            self.snapshot_converted.emit(str(file_path), str(e))
 
-    def capture_screenshot(self, screenshot_path: Path, file_path: Path):
-        try:
-            if platform.system() == "Linux":
-                subprocess.run(['import', str(screenshot_path)], check=True)
-            elif platform.system() == "Windows":
-                import win32gui
-                import win32ui
-                import win32con
-                import win32api
-                from ctypes import windll
-                
-                hwnd = win32gui.GetDesktopWindow()
-                width = win32api.GetSystemMetrics(win32con.SM_CXVIRTUALSCREEN)
-                height = win32api.GetSystemMetrics(win32con.SM_CYVIRTUALSCREEN)
-                left = win32api.GetSystemMetrics(win32con.SM_XVIRTUALSCREEN)
-                top = win32api.GetSystemMetrics(win32con.SM_YVIRTUALSCREEN)
-                
-                hwindc = win32gui.GetWindowDC(hwnd)
-                srcdc = win32ui.CreateDCFromHandle(hwindc)
-                memdc = srcdc.CreateCompatibleDC()
-                bmp = win32ui.CreateBitmap()
-                bmp.CreateCompatibleBitmap(srcdc, width, height)
-                memdc.SelectObject(bmp)
-                windll.user32.PrintWindow(hwnd, memdc.GetSafeHdc(), 0)
-                bmp.SaveBitmapFile(memdc, str(screenshot_path))
-            elif platform.system() == "Darwin":  # macOS
-                subprocess.run(['screencapture', '-i', str(screenshot_path)], check=True)
-            else:
-                raise OSError(f"Unsupported operating system: {platform.system()}")
-            
-            logger.info(f"Snapshot saved successfully at: {screenshot_path}")
-            self.update_snapshot_preview(screenshot_path)
-            self.update_snapshot_path_in_json(screenshot_path.stem, f"/preview/snapshot/{screenshot_path.name}")
-            
-            # Refresh the UI and reselect the item
-            self.refresh_ui()
-            self.reselect_file(file_path)
-        except subprocess.CalledProcessError as e:
-            logger.error(f"Error capturing screenshot: {e}")
-            self.show_error_dialog("Screenshot Capture Failed", f"Failed to capture screenshot: {e}")
-        except Exception as e:
-            logger.error(f"Unexpected error capturing screenshot: {e}")
-            self.show_error_dialog("Screenshot Capture Failed", f"Unexpected error capturing screenshot: {e}")
-        finally:
-            self.show()
+    def on_snapshot_converted(self, file_path: str, error: str):
+        if error:
+            logger.error(f"Error updating snapshot: {error}")
+            self.show_error_dialog("Snapshot Update Failed", f"Failed to update snapshot: {error}")
+            return
+
+        file_path = Path(file_path)
+        self.update_snapshot_path_in_json(file_path.stem, SNAP_ENTRY_TEMPLATE.format(name=file_path.stem))
+        # The old snapshot's pixmap is still cached under the same path
+        self.invalidate_cache(file_path.stem)
+
+        # The file list is unchanged; reselecting decodes the new snapshot off-thread
+        self.reselect_file(file_path)
+
+    @staticmethod
+    def grab_desktop_pixmap() -> QtGui.QPixmap:
+        # Grab through Qt's screen backend and stitch monitors into one virtual desktop
+        screens = QtGui.QGuiApplication.screens()
+        if len(screens) == 1:
+            return screens[0].grabWindow(0)
+
+        virtual_rect = QtCore.QRect()
+        for screen in screens:
+            virtual_rect = virtual_rect.united(screen.geometry())
+
+        pixmap = QtGui.QPixmap(virtual_rect.size())
+        pixmap.fill(QtCore.Qt.black)
+        painter = QtGui.QPainter(pixmap)
+        for screen in screens:
+            painter.drawPixmap(screen.geometry().topLeft() - virtual_rect.topLeft(), screen.grabWindow(0))
+        painter.end()
+        return pixmap
 
     def update_flipbook_path_in_json(self, file_name: str, new_flipbook_path: str):
         logger.debug(f"Updating flipbook path for {file_name} to {new_flipbook_path}")
-        user = self.user_combo.currentText()
-        master_json_path = self.base_path / 'pyDump' / user / 'Snips' / 'descriptions' / 'master.json'
-
         try:
-            with master_json_path.open('r') as f:
-                master_data = json.load(f)
-
-            updated = False
-            for entry in master_data:
-                if entry['File Name'] == file_name:
-                    entry['Flipbook'] = f"/preview/flipbook/{file_name}/{new_flipbook_path}"
-                    updated = True
-                    break
-
-            if not updated:
+            entry = self.get_master_entry(file_name)
+            if entry is None:
                 logger.warning(f"No existing entry found for {file_name}. This should not happen.")
                 return
 
-            with master_json_path.open('w') as f:
-                json.dump(master_data, f, indent=4)
-
-            # Update the local json_data cache
-            for entry in self.json_data:
-                if entry['File Name'] == file_name:
-                    entry['Flipbook'] = f"/preview/flipbook/{file_name}/{new_flipbook_path}"
-                    break
+            entry['Flipbook'] = f"/preview/flipbook/{file_name}/{new_flipbook_path}"
+            self.mark_master_dirty()
+            self.invalidate_cache(file_name)  # the flipbook on disk changed; drop cached previews and rescan lazily
 
             logger.info(f"Successfully updated flipbook path for {file_name}")
 
         except Exception as e:
-            logger.error(f"Error updating flipbook path in JSON: {e}", exc_info=True)
+            logger.error(f"Error updating flipbook path in JSON: {e}", exc_info=logger.isEnabledFor(logging.DEBUG))
             self.show_error_dialog("Update Failed", f"Failed to update flipbook path: {e}")
 
     def update_snapshot_path_in_json(self, file_name: str, new_snapshot_path: str):
         try:
-            user = self.user_combo.currentText()
-            master_json_path = self.file_manager.base_path / 'pyDump' / user / 'Snips' / 'descriptions' / 'master.json'
-            if not master_json_path.exists():
-                logger.warning(f"master.json not found at {master_json_path}. Creating a new one.")
-                master_data = []
-            else:
-                with master_json_path.open('r') as f:
-                    master_data = json.load(f)
-
-            for entry in master_data:
-                if entry['File Name'] == file_name:
-                    entry['Snap'] = new_snapshot_path
-                    break
-            else:
-                # If the file entry doesn't exist, create one
-                new_entry = {
-                    "File Name": file_name,
-                    "Snap": new_snapshot_path,
-                    # Add other necessary fields if required
-                }
-                master_data.append(new_entry)
-
-            with master_json_path.open('w') as f:
-                json.dump(master_data, f, indent=4)
+            self.get_master_entry(file_name, create=True)['Snap'] = new_snapshot_path
+            self.mark_master_dirty()
+            self.invalidate_cache(file_name)  # the snapshot on disk changed; drop cached previews and rescan lazily
             logger.info(f"Updated Snapshot path in master.json for {file_name}")
 
         except Exception as e:
-            logger.error(f"Error updating Snapshot path in master.json: {e}", exc_info=True)
+            logger.error(f"Error updating Snapshot path in master.json: {e}", exc_info=logger.isEnabledFor(logging.DEBUG))
             self.show_error_dialog("Snapshot Path Update Failed", f"Failed to update Snapshot path in master.json: {e}")
 
     def save_flipbook(self):
@@ -2513,11 +2873,10 @@ class MyShelfToolUI(QtWidgets.QWidget):
             return
 
         selected_item = selected_items[0]
-        file_path = Path(selected_item.data(0, QtCore.Qt.UserRole))
+        file_path = selected_item.data(0, QtCore.Qt.UserRole).path
         file_name = file_path.stem
 
-        user = self.user_combo.currentText()
-        flipbook_base_folder = self.file_manager.get_preview_base_path(user) / "flipbook"
+        flipbook_base_folder = self._preview_paths()['flipbook']
         flipbook_sequence_folder = flipbook_base_folder / file_name
         flipbook_path = flipbook_sequence_folder / f"{file_name}.$F4.png"
 
@@ -2555,7 +2914,9 @@ class MyShelfToolUI(QtWidgets.QWidget):
         flipbook_sequence_folder.mkdir(parents=True, exist_ok=True)
         
         try:
-            hou.hipFile.save()
+            # Only rewrite the .hip when there is something to save
+            if hou.hipFile.hasUnsavedChanges():
+                hou.hipFile.save()
             scene_viewer = toolutils.sceneViewer()
             flipbook_settings = scene_viewer.flipbookSettings()
             flipbook_settings.frameRange((start_frame, end_frame))
@@ -2580,7 +2941,7 @@ class MyShelfToolUI(QtWidgets.QWidget):
 
     def create_gif_from_flipbook(self, flipbook_folder: Path, flipbook_path: Path):
         try:
-            png_files = sorted(flipbook_folder.glob('*.png'))
+            png_files = [f for f in _scan_images(flipbook_folder) if f.suffix == '.png']
             
             if not png_files:
                 logger.warning("No PNG files found in the flipbook folder.")
@@ -2612,11 +2973,10 @@ class MyShelfToolUI(QtWidgets.QWidget):
             return
 
         selected_item = selected_items[0]
-        file_path = Path(selected_item.data(0, QtCore.Qt.UserRole))
+        file_path = selected_item.data(0, QtCore.Qt.UserRole).path
         file_name = file_path.stem
 
-        user = self.user_combo.currentText()
-        snapshot_dir = self.file_manager.get_preview_base_path(user) / "snapshot"
+        snapshot_dir = self._preview_paths()['snapshot']
         snapshot_dir.mkdir(parents=True, exist_ok=True)
         
         screenshot_path = snapshot_dir / f"{file_name}.png"
@@ -2634,20 +2994,43 @@ class MyShelfToolUI(QtWidgets.QWidget):
                                                QtWidgets.QMessageBox.Yes | QtWidgets.QMessageBox.No,
                                                QtWidgets.QMessageBox.No)
         if reply == QtWidgets.QMessageBox.Yes:
-            QtCore.QTimer.singleShot(100, lambda: self.perform_snapshot(screenshot_path, file_path))
+            self.perform_snapshot(screenshot_path, file_path)
 
     def perform_snapshot(self, screenshot_path: Path, file_path: Path):
         try:
-            self.hide()
             main_window = hou.qt.mainWindow()
+            self.pending_snapshot = (screenshot_path, file_path)
+            self.snapshot_main_window = main_window
+            main_window.installEventFilter(self)
+
+            # hide() is synchronous, so only the main window activation is awaited
+            self.hide()
             main_window.raise_()
             main_window.activateWindow()
-            QtCore.QTimer.singleShot(500, lambda: self.capture_screenshot(screenshot_path, file_path))
+            self.snapshot_fallback_timer.start(500)
         except Exception as e:
+            self.pending_snapshot = None
             logger.error(f"Error preparing for screenshot: {e}")
             self.show_error_dialog("Screenshot Preparation Failed", f"Error preparing for screenshot: {e}")
             self.show()
 
+    def eventFilter(self, watched, event):
+        if (self.pending_snapshot and watched is self.snapshot_main_window
+                and event.type() == QtCore.QEvent.WindowActivate):
+            # Give the compositor one short beat to repaint the uncovered area
+            self.snapshot_fallback_timer.start(50)
+        return super().eventFilter(watched, event)
+
+    def fire_pending_snapshot(self):
+        if not self.pending_snapshot:
+            return
+        screenshot_path, file_path = self.pending_snapshot
+        self.pending_snapshot = None
+        if self.snapshot_main_window:
+            self.snapshot_main_window.removeEventFilter(self)
+            self.snapshot_main_window = None
+        self.capture_screenshot(screenshot_path, file_path)
+
     def capture_screenshot(self, screenshot_path: Path, file_path: Path):
         try:
             if platform.system() == "Linux":
@@ -2672,26 +3055,8 @@ class MyShelfToolUI(QtWidgets.QWidget):
                     raise RuntimeError("No suitable screenshot tool found. Please install gnome-screenshot, xfce4-screenshooter, spectacle, or scrot.")
                     
             elif platform.system() == "Windows":
-                import win32gui
-                import win32ui
-                import win32con
-                import win32api
-                from ctypes import windll
-                
-                hwnd = win32gui.GetDesktopWindow()
-                width = win32api.GetSystemMetrics(win32con.SM_CXVIRTUALSCREEN)
-                height = win32api.GetSystemMetrics(win32con.SM_CYVIRTUALSCREEN)
-                left = win32api.GetSystemMetrics(win32con.SM_XVIRTUALSCREEN)
-                top = win32api.GetSystemMetrics(win32con.SM_YVIRTUALSCREEN)
-                
-                hwindc = win32gui.GetWindowDC(hwnd)
-                srcdc = win32ui.CreateDCFromHandle(hwindc)
-                memdc = srcdc.CreateCompatibleDC()
-                bmp = win32ui.CreateBitmap()
-                bmp.CreateCompatibleBitmap(srcdc, width, height)
-                memdc.SelectObject(bmp)
-                windll.user32.PrintWindow(hwnd, memdc.GetSafeHdc(), 0)
-                bmp.SaveBitmapFile(memdc, str(screenshot_path))
+                if not self.grab_desktop_pixmap().save(str(screenshot_path), 'PNG'):
+                    raise RuntimeError(f"Failed to save screenshot to {screenshot_path}")
                 
             elif platform.system() == "Darwin":  # macOS
                 subprocess.run(['screencapture', '-i', str(screenshot_path)], check=True)
@@ -2700,7 +3065,7 @@ class MyShelfToolUI(QtWidgets.QWidget):
             
             logger.info(f"Snapshot saved successfully at: {screenshot_path}")
             self.update_snapshot_preview(screenshot_path)
-            self.update_snapshot_path_in_json(screenshot_path.stem, f"/preview/snapshot/{screenshot_path.name}")
+            self.update_snapshot_path_in_json(screenshot_path.stem, SNAP_ENTRY_TEMPLATE.format(name=screenshot_path.stem))
             
             # Refresh the UI and reselect the item
             self.refresh_ui()
@@ -2728,62 +3093,19 @@ class MyShelfToolUI(QtWidgets.QWidget):
             return
 
         selected_item = selected_items[0]
-        file_path = Path(selected_item.data(0, QtCore.Qt.UserRole))
-        user = self.user_combo.currentText()
+        file_path = selected_item.data(0, QtCore.Qt.UserRole).path
+        stem = file_path.stem
 
         reply = self.show_question_dialog("Confirm Flipbook Deletion", 
-                                          f"Are you sure you want to delete the flipbook for {file_path.stem}?",
+                                          f"Are you sure you want to delete the flipbook for {stem}?",
                                           QtWidgets.QMessageBox.Yes | QtWidgets.QMessageBox.No,
                                           QtWidgets.QMessageBox.No)
         
         if reply == QtWidgets.QMessageBox.Yes:
-            try:
-                # Delete flipbook directory
-                flipbook_dir = self.base_path / 'pyDump' / user / 'Snips' / 'preview' / 'flipbook' / file_path.stem
-                if flipbook_dir.exists():
-                    shutil.rmtree(flipbook_dir)
-                    logger.info(f"Deleted flipbook directory: {flipbook_dir}")
-                else:
-                    logger.warning(f"Flipbook directory not found: {flipbook_dir}")
-
-                # Update master.json
-                master_json_path = self.base_path / 'pyDump' / user / 'Snips' / 'descriptions' / 'master.json'
-                if master_json_path.exists():
-                    with master_json_path.open('r') as f:
-                        master_data = json.load(f)
-                    
-                    for entry in master_data:
-                        if entry['File Name'] == file_path.stem:
-                            if 'Flipbook' in entry:
-                                del entry['Flipbook']
-                                logger.info(f"Removed Flipbook entry for {file_path.stem} in master.json")
-                            break
-                    
-                    with master_json_path.open('w') as f:
-                        json.dump(master_data, f, indent=4)
-                else:
-                    logger.warning(f"master.json not found: {master_json_path}")
-
-                # Clear the caches
-                self.json_cache.pop(file_path.stem, None)
-                self.preview_cache.pop(file_path.stem, None)
-
-                # Update local json_data
-                for entry in self.json_data:
-                    if entry['File Name'] == file_path.stem:
-                        if 'Flipbook' in entry:
-                            del entry['Flipbook']
-                        break
-
-                self.show_info_dialog("Flipbook Deleted", f"Flipbook for {file_path.stem} has been deleted.")
-                
-                # Refresh the UI and reselect the item
-                self.refresh_ui()
-                self.reselect_file(file_path)
-                
-            except Exception as e:
-                logger.error(f"Error deleting flipbook: {e}", exc_info=True)
-                self.show_error_dialog("Flipbook Deletion Failed", f"Failed to delete flipbook: {e}")
+            # rmtree on a long sequence can take a while; on_preview_deleted finishes on the GUI thread
+            flipbook_dir = self._preview_paths()['flipbook'] / stem
+            self.show_status_message(f"Deleting flipbook for {stem}...")
+            self.thread_pool.submit(self.remove_preview, 'flipbook', flipbook_dir, file_path)
         else:
             self.show_info_dialog("Deletion Cancelled", "The flipbook was not deleted.")
 
@@ -2795,13 +3117,12 @@ class MyShelfToolUI(QtWidgets.QWidget):
             return
 
         selected_item = selected_items[0]
-        file_path = Path(selected_item.data(0, QtCore.Qt.UserRole))
+        file_path = selected_item.data(0, QtCore.Qt.UserRole).path
         file_name = file_path.stem
 
-        user = self.user_combo.currentText()
-        snapshot_path = self.file_manager.get_preview_base_path(user) / "snapshot" / f"{file_name}.png"
+        snapshot_path = self._preview_paths()['snapshot'] / f"{file_name}.png"
 
-        if not snapshot_path.exists():
+        if not self.preview_exists(file_name, 'snapshot', snapshot_path):
             self.show_warning_dialog("No Snapshot", "There is no snapshot to delete for this file.")
             return
 
@@ -2810,113 +3131,176 @@ class MyShelfToolUI(QtWidgets.QWidget):
                                           QtWidgets.QMessageBox.Yes | QtWidgets.QMessageBox.No,
                                           QtWidgets.QMessageBox.No)
         if reply == QtWidgets.QMessageBox.Yes:
-            try:
-                snapshot_path.unlink()
-                logger.info(f"Snapshot deleted successfully: {snapshot_path}")
-                self.update_snapshot_path_in_json(file_name, "")
-                self.show_info_dialog("Snapshot Deleted", "The snapshot has been successfully deleted.")
-                
-                # Refresh the UI and reselect the item
-                self.refresh_ui()
-                self.reselect_file(file_path)
-            except Exception as e:
-                logger.error(f"Error deleting snapshot: {e}")
-                self.show_error_dialog("Snapshot Deletion Failed", f"Failed to delete snapshot: {e}")
+            self.show_status_message(f"Deleting snapshot for {file_name}...")
+            self.thread_pool.submit(self.remove_preview, 'snapshot', snapshot_path, file_path)
 
-    def preload_nearby_items(self):
-        current_item = self.file_list_widget.currentItem()
-        if current_item:
-            index = self.file_list_widget.indexOfTopLevelItem(current_item)
-            for i in range(max(0, index-2), min(self.file_list_widget.topLevelItemCount(), index+3)):
-                item = self.file_list_widget.topLevelItem(i)
-                if item and not item.childCount():
-                    file_path = Path(item.data(0, QtCore.Qt.UserRole))
-                    if file_path.stem not in self.preview_cache:
-                        asyncio.ensure_future(self.preload_item(file_path.stem))
-
-    async def preload_item(self, file_stem):
-        json_data = await self.load_json_data_async(file_stem)
-        if json_data:
-            await self.load_preview_assets_async(json_data)
+    def remove_preview(self, kind: str, target: Path, file_path: Path):
+        # Runs on self.thread_pool; only touches the filesystem and emits a queued signal
+        try:
+            if kind == 'flipbook':
+                _remove_flipbook_dir(target)
+            else:
+                target.unlink()
+            logger.info(f"Deleted {kind}: {target}")
+        except FileNotFoundError:
+            # Already gone, so the master entry still needs clearing
+            logger.warning(f"{kind.capitalize()} not found: {target}")
+        except Exception as e:
+            self.preview_deleted.emit(kind, str(file_path), str(e))
+            return
+        self.preview_deleted.emit(kind, str(file_path), "")
 
-    def format_name(self, input_string):
-        # Remove special characters and spaces
-        cleaned = re.sub(r'[^a-zA-Z0-9 ]', '', input_string)
-        
-        # Split the string into words
-        words = cleaned.split()
-        
-        # Capitalize the first letter of each word except the first one
-        formatted = words[0].lower() + ''.join(word.capitalize() for word in words[1:])
-        
-        return formatted
+    def on_preview_deleted(self, kind: str, file_path: str, error: str):
+        title = kind.capitalize()
+        if error:
+            logger.error(f"Error deleting {kind}: {error}")
+            self.show_error_dialog(f"{title} Deletion Failed", f"Failed to delete {kind}: {error}")
+            return
 
-    def update_item_name(self, item, new_full_name, updated_column):
-        old_file_path = Path(item.data(0, QtCore.Qt.UserRole))
-        old_full_name = old_file_path.stem
-        user = self.user_combo.currentText()
-        
-        # Update the file name
-        new_file_path = old_file_path.with_name(f"{new_full_name}{old_file_path.suffix}")
+        file_path = Path(file_path)
+        stem = file_path.stem
         try:
-            old_file_path.rename(new_file_path)
+            if kind == 'flipbook':
+                entry = self.get_master_entry(stem)
+                if entry is not None and entry.pop('Flipbook', None) is not None:
+                    self.mark_master_dirty()
+                    logger.info(f"Removed Flipbook entry for {stem} in master.json")
+                message = f"Flipbook for {stem} has been deleted."
+            else:
+                self.update_snapshot_path_in_json(stem, "")
+                message = "The snapshot has been successfully deleted."
+
+            # Clear the caches
+            self.invalidate_cache(stem)
+
+            self.show_info_dialog(f"{title} Deleted", message)
+
+            # The file list itself is unchanged, so only the previews need reloading
+            self.reselect_file(file_path)
         except Exception as e:
-            self.show_error_dialog("Rename Failed", f"Failed to rename file: {e}")
-            return
+            logger.error(f"Error deleting {kind}: {e}", exc_info=logger.isEnabledFor(logging.DEBUG))
+            self.show_error_dialog(f"{title} Deletion Failed", f"Failed to delete {kind}: {e}")
 
-        # Update flipbook directory and image sequence
-        old_flipbook_dir = self.file_manager.get_preview_base_path(user) / 'flipbook' / old_full_name
-        new_flipbook_dir = self.file_manager.get_preview_base_path(user) / 'flipbook' / new_full_name
-        if old_flipbook_dir.exists():
-            try:
-                old_flipbook_dir.rename(new_flipbook_dir)
-                # Rename individual flipbook frames
-                for file in new_flipbook_dir.glob(f"{old_full_name}.*"):
-                    new_file_name = file.name.replace(old_full_name, new_full_name)
-                    file.rename(new_flipbook_dir / new_file_name)
-            except Exception as e:
-                self.show_error_dialog("Rename Failed", f"Failed to rename flipbook directory: {e}")
-                return
+    def scan_preview_dirs(self):
+        # One listing per preview folder replaces two stats per file on rename
+        preview_paths = self._preview_paths()
+        flipbook_stems, snapshot_stems = set(), set()
+        try:
+            with os.scandir(preview_paths['flipbook']) as entries:
+                flipbook_stems = {entry.name for entry in entries if entry.is_dir()}
+        except OSError:
+            pass
+        try:
+            with os.scandir(preview_paths['snapshot']) as entries:
+                snapshot_stems = {entry.name[:-4] for entry in entries if entry.name.endswith('.png')}
+        except OSError:
+            pass
+
+        self.has_preview = {
+            stem: {'flipbook': stem in flipbook_stems, 'snapshot': stem in snapshot_stems}
+            for stem in (Path(path).stem for path in self.file_items_by_path)
+        }
+
+    def preview_exists(self, stem: str, kind: str, path: Path) -> bool:
+        state = self.has_preview.get(stem)
+        if state is None:  # Not scanned or invalidated since, ask the filesystem
+            return path.exists()
+        return state[kind]
+
+    def get_nearby_stems(self, current_item) -> set:
+        stems = {current_item.data(0, QtCore.Qt.UserRole).stem}
+        for get_next in (self.file_list_widget.itemAbove, self.file_list_widget.itemBelow):
+            item, found = current_item, 0
+            while found < PRELOAD_RANGE:
+                item = get_next(item)
+                if item is None:
+                    break
+                if item.childCount():  # Skip group headers
+                    continue
+                stems.add(item.data(0, QtCore.Qt.UserRole).stem)
+                found += 1
+        return stems
 
-        # Update snapshot file
-        old_snapshot_path = self.file_manager.get_preview_base_path(user) / 'snapshot' / f"{old_full_name}.png"
-        new_snapshot_path = self.file_manager.get_preview_base_path(user) / 'snapshot' / f"{new_full_name}.png"
-        if old_snapshot_path.exists():
-            try:
-                old_snapshot_path.rename(new_snapshot_path)
-            except Exception as e:
-                self.show_error_dialog("Rename Failed", f"Failed to rename snapshot file: {e}")
-                return
+    def preload_nearby_items(self):
+        current_item = self.file_list_widget.currentItem()
+        if not current_item or current_item.childCount():
+            return
 
-        # Update the JSON data
-        self.update_json_data(old_full_name, new_full_name, new_flipbook_dir, new_snapshot_path)
+        # The selected file is loaded by the preview itself
+        wanted = self.get_nearby_stems(current_item) - {current_item.data(0, QtCore.Qt.UserRole).stem}
+
+        # Drop preloads that scrolled out of the window so they stop competing for the pool
+        for stem in [stem for stem in self.preload_tasks if stem not in wanted]:
+            self.preload_tasks.pop(stem).cancel()
+
+        preview_paths = self._preview_paths()
+        for stem in wanted:
+            if stem in self.preload_tasks or stem in self.preview_cache:
+                continue
+            json_data = self.master_index.get(stem)
+            if not json_data:
+                continue
+            # Presence is answered here from the preview scan; the worker only decodes
+            flipbook_path = snapshot_path = None
+            if json_data.get('Flipbook') and self.preview_exists(stem, 'flipbook', preview_paths['flipbook'] / stem):
+                flipbook_path = str(preview_paths['flipbook'] / stem / f"{stem}.$F4.png")
+            if json_data.get('Snap') and self.preview_exists(stem, 'snapshot', preview_paths['snapshot'] / f"{stem}.png"):
+                snapshot_path = str(preview_paths['snapshot'] / f"{stem}.png")
+            self.preload_tasks[stem] = self.thread_pool.submit(
+                self.prefetch_preview, stem, json_data, flipbook_path, snapshot_path)
+
+    def prefetch_preview(self, stem: str, json_data: Dict, flipbook_path: Optional[str], snapshot_path: Optional[str]):
+        # Runs on self.thread_pool; decodes QImages only and hands them back through a queued
+        # signal. The payload is also the job's result, for adopt_preload to wait on
+        try:
+            frames = self.preview_manager.read_flipbook(flipbook_path) if flipbook_path else []
+            snapshot = self.preview_manager.read_snapshot(snapshot_path) if snapshot_path else None
+            payload = (json_data, frames, snapshot_path, snapshot)
+        except Exception as e:
+            logger.debug(f"Preloading {stem} failed: {e}")
+            payload = None  # Left for the selection's own load to retry
+        self.preview_prefetched.emit(stem, payload)
+        return payload
 
-        # Refresh the UI
-        self.refresh_ui()
-        self.reselect_file(new_file_path)
+    def on_preview_prefetched(self, stem: str, payload):
+        if self.preload_tasks.pop(stem, None) is None:  # Invalidated, adopted or scrolled away meanwhile
+            return
+        if payload is not None:
+            # Cached only; the widgets keep showing the selected file
+            self.cache_prefetched(stem, payload)
+
+    def cache_prefetched(self, stem: str, payload):
+        json_data, frames, snapshot_path, snapshot = payload
+        flipbook_frames = [QtGui.QPixmap.fromImage(image) for image in frames]
+        snapshot_pixmap = self.preview_manager.cache_snapshot(snapshot_path, snapshot) if snapshot_path else None
+        self.cache_preview(stem, json_data, flipbook_frames, snapshot_pixmap)
+
+    def adopt_preload(self, stem: str) -> bool:
+        # The selected file is often a neighbour whose preload is already decoding;
+        # wait for that job instead of decoding the same frames a second time
+        preload_task = self.preload_tasks.pop(stem, None)
+        if preload_task is None or preload_task.cancel():  # Still queued: cheaper to load it directly
+            return False
+        payload = preload_task.result()
+        if payload is None:
+            return False
+        self.cache_prefetched(stem, payload)
+        return self.show_cached_preview(stem)
 
-        self.show_info_dialog("Name Updated", f"Successfully updated the {['Context', 'Type', 'Name', 'Source', 'Version'][updated_column]}")
+    def cancel_queued_preloads(self):
+        # Preloads already running finish; only those still waiting for a worker are dropped
+        for stem in [stem for stem, task in self.preload_tasks.items() if task.cancel()]:
+            del self.preload_tasks[stem]
 
-    def reselect_file(self, file_path: Path):
-        for i in range(self.file_list_widget.topLevelItemCount()):
-            group_item = self.file_list_widget.topLevelItem(i)
-            for j in range(group_item.childCount()):
-                file_item = group_item.child(j)
-                if Path(file_item.data(0, QtCore.Qt.UserRole)) == file_path:
-                    self.file_list_widget.setCurrentItem(file_item)
-                    self.update_preview()
-                    return
-        logger.warning(f"Could not find item to reselect: {file_path}")
+    def format_name(self, input_string):
+        return _format_name(input_string)
 
     def reselect_file(self, file_path: Path):
-        for i in range(self.file_list_widget.topLevelItemCount()):
-            group_item = self.file_list_widget.topLevelItem(i)
-            for j in range(group_item.childCount()):
-                file_item = group_item.child(j)
-                if Path(file_item.data(0, QtCore.Qt.UserRole)) == file_path:
-                    self.file_list_widget.setCurrentItem(file_item)
-                    self.update_preview()
-                    return
+        file_item = self.file_items_by_path.get(str(file_path))
+        if file_item:
+            self.file_list_widget.setCurrentItem(file_item)
+            self.update_preview()
+            return
         logger.warning(f"Could not find item to reselect: {file_path}")
         
     def on_item_changed(self, item, column):
@@ -2924,7 +3308,7 @@ class MyShelfToolUI(QtWidgets.QWidget):
             return
 
         try:
-            old_full_name = Path(item.data(0, QtCore.Qt.UserRole)).stem
+            old_full_name = item.data(0, QtCore.Qt.UserRole).stem
             parts = old_full_name.split('_')
             
             if len(parts) != 5:
@@ -2932,162 +3316,223 @@ class MyShelfToolUI(QtWidgets.QWidget):
                 return
 
             new_value = item.text(column)
+            # itemChanged also fires for setData and our own setText calls; nothing to do
+            # when the cell still shows what the file name says
+            displayed_value = self.camel_case_to_words(parts[2]) if column == 2 else parts[column]
+            if new_value == displayed_value:
+                return
             formatted_value = self.format_name(new_value)
 
-            new_parts = parts.copy()
-            if column == 0:  # Context
-                new_parts[0] = formatted_value.upper()
-            elif column == 1:  # Type
-                new_parts[1] = formatted_value
-            elif column == 2:  # Name
-                new_parts[2] = formatted_value
-            elif column == 3:  # Source
-                new_parts[3] = formatted_value
-            elif column == 4:  # Version
-                new_parts[4] = formatted_value.lower()
-
-            new_full_name = '_'.join(new_parts)
+            parts[column] = self.COLUMN_TRANSFORMS[column](formatted_value)
+            new_full_name = '_'.join(parts)
             
             # Only update if the name has actually changed
             if new_full_name != old_full_name:
                 self.update_item_name(item, new_full_name, column)
             else:
-                # If no change, just update the displayed text to the formatted version
-                item.setText(column, new_parts[column])
+                # If no change, just restore the displayed text
+                item.setText(column, displayed_value)
 
         except Exception as e:
-            logger.error(f"Error in on_item_changed: {str(e)}", exc_info=True)
+            logger.error(f"Error in on_item_changed: {str(e)}", exc_info=logger.isEnabledFor(logging.DEBUG))
             self.show_error_dialog("Update Failed", f"An error occurred while updating the item: {str(e)}")
 
     def update_item_name(self, item, new_full_name, updated_column):
-        old_file_path = Path(item.data(0, QtCore.Qt.UserRole))
+        old_file_path = item.data(0, QtCore.Qt.UserRole).path
         old_full_name = old_file_path.stem
-        user = self.user_combo.currentText()
-        
-        # Update the file name
+        preview_paths = self._preview_paths()
+
+        # Preview presence is answered here from the preview scan; listing the frames and
+        # every rename run as one batch on the pool, and on_item_renamed applies the result
         new_file_path = old_file_path.with_name(f"{new_full_name}{old_file_path.suffix}")
+        rename_groups = [('file', [(str(old_file_path), str(new_file_path))])]
+
+        flipbook_dirs = None
+        old_flipbook_dir = preview_paths['flipbook'] / old_full_name
+        if self.preview_exists(old_full_name, 'flipbook', old_flipbook_dir):
+            flipbook_dirs = (old_flipbook_dir, preview_paths['flipbook'] / new_full_name)
+
+        old_snapshot_path = preview_paths['snapshot'] / f"{old_full_name}.png"
+        new_snapshot_path = preview_paths['snapshot'] / f"{new_full_name}.png"
+        if self.preview_exists(old_full_name, 'snapshot', old_snapshot_path):
+            rename_groups.append(('snapshot', [(str(old_snapshot_path), str(new_snapshot_path))]))
+
+        self.show_status_message(f"Renaming {old_full_name}...")
+        self.thread_pool.submit(self.rename_item_files, old_file_path, new_full_name, updated_column,
+                                rename_groups, flipbook_dirs)
+
+    def rename_item_files(self, old_file_path: Path, new_full_name: str, updated_column: int,
+                          rename_groups, flipbook_dirs: Optional[Tuple[Path, Path]]):
+        # Runs on self.thread_pool: the file itself, then the flipbook directory and its frames,
+        # then the snapshot. Errors travel as strings through the queued signal
+        failures = {}
+        if flipbook_dirs is not None:
+            old_flipbook_dir, new_flipbook_dir = flipbook_dirs
+            old_full_name = old_file_path.stem
+            try:
+                # The directory moves first, so the frames are renamed under the new directory;
+                # the frame suffix (".0001.png") is spliced on rather than re-parsed
+                frame_prefix = f"{old_full_name}."
+                prefix_len = len(old_full_name)
+                dir_prefix = os.path.join(str(new_flipbook_dir), '')
+                with os.scandir(old_flipbook_dir) as entries:
+                    frame_names = [entry.name for entry in entries if entry.name.startswith(frame_prefix)]
+                flipbook_pairs = [(str(old_flipbook_dir), str(new_flipbook_dir))]
+                flipbook_pairs += [(dir_prefix + name, dir_prefix + new_full_name + name[prefix_len:])
+                                   for name in frame_names]
+                rename_groups.insert(1, ('flipbook', flipbook_pairs))
+            except OSError as e:
+                failures['flipbook'] = e
         try:
-            if old_file_path.exists():
-                old_file_path.rename(new_file_path)
-                logger.info(f"Renamed file from {old_file_path} to {new_file_path}")
-            else:
-                logger.warning(f"Old file does not exist: {old_file_path}")
-                raise FileNotFoundError(f"Old file does not exist: {old_file_path}")
+            failures.update(_rename_batch(rename_groups))
+        except Exception as e:
+            failures['file'] = e
+        self.item_renamed.emit(str(old_file_path), new_full_name, updated_column,
+                               {label: str(error) for label, error in failures.items()})
 
-            # Update flipbook directory and image sequence
-            old_flipbook_dir = self.base_path / 'pyDump' / user / 'Snips' / 'preview' / 'flipbook' / old_full_name
-            new_flipbook_dir = self.base_path / 'pyDump' / user / 'Snips' / 'preview' / 'flipbook' / new_full_name
-            if old_flipbook_dir.exists():
-                try:
-                    # Rename image sequence files
-                    for old_file in old_flipbook_dir.glob(f"{old_full_name}.*"):
-                        frame_number = old_file.stem.split('.')[-1]
-                        new_file_name = f"{new_full_name}.{frame_number}{old_file.suffix}"
-                        old_file.rename(old_flipbook_dir / new_file_name)
-                    
-                    # Rename the directory
-                    old_flipbook_dir.rename(new_flipbook_dir)
-                    logger.info(f"Renamed flipbook directory from {old_flipbook_dir} to {new_flipbook_dir}")
-                except Exception as e:
-                    logger.error(f"Error updating flipbook: {e}", exc_info=True)
-                    self.show_error_dialog("Flipbook Update Failed", f"Failed to update flipbook: {e}")
-
-            # Update snapshot
-            old_snapshot_path = self.base_path / 'pyDump' / user / 'Snips' / 'preview' / 'snapshot' / f"{old_full_name}.png"
-            new_snapshot_path = self.base_path / 'pyDump' / user / 'Snips' / 'preview' / 'snapshot' / f"{new_full_name}.png"
-            if old_snapshot_path.exists():
-                try:
-                    old_snapshot_path.rename(new_snapshot_path)
-                    logger.info(f"Renamed snapshot from {old_snapshot_path} to {new_snapshot_path}")
-                except Exception as e:
-                    logger.error(f"Error updating snapshot: {e}", exc_info=True)
-                    self.show_error_dialog("Snapshot Update Failed", f"Failed to update snapshot: {e}")
-
-            # Update master.json
-            master_json_path = self.base_path / 'pyDump' / user / 'Snips' / 'descriptions' / 'master.json'
-            try:
-                with master_json_path.open('r') as f:
-                    master_data = json.load(f)
-                
-                for entry in master_data:
-                    if entry['File Name'] == old_full_name:
-                        entry['File Name'] = new_full_name
-                        if 'Flipbook' in entry:
-                            entry['Flipbook'] = entry['Flipbook'].replace(old_full_name, new_full_name)
-                        if 'Snap' in entry:
-                            entry['Snap'] = entry['Snap'].replace(old_full_name, new_full_name)
-                        break
-                
-                with master_json_path.open('w') as f:
-                    json.dump(master_data, f, indent=4)
-                
-                logger.info(f"Updated master.json: renamed {old_full_name} to {new_full_name}")
-            except Exception as e:
-                logger.error(f"Error updating master.json: {e}", exc_info=True)
-                self.show_error_dialog("JSON Update Failed", f"Failed to update master.json: {e}")
-
-            # Update the item's data
-            item.setData(0, QtCore.Qt.UserRole, str(new_file_path))
-
-            # Update local json_data cache
-            for entry in self.json_data:
-                if entry['File Name'] == old_full_name:
-                    entry['File Name'] = new_full_name
-                    if 'Flipbook' in entry:
-                        entry['Flipbook'] = entry['Flipbook'].replace(old_full_name, new_full_name)
-                    if 'Snap' in entry:
-                        entry['Snap'] = entry['Snap'].replace(old_full_name, new_full_name)
-                    break
+    def on_item_renamed(self, old_file_path: str, new_full_name: str, updated_column: int, failures: Dict[str, str]):
+        old_file_path = Path(old_file_path)
+        old_full_name = old_file_path.stem
+        new_file_path = old_file_path.with_name(f"{new_full_name}{old_file_path.suffix}")
+        # A refresh may have rebuilt the tree while the rename ran
+        item = self.file_items_by_path.get(str(old_file_path))
+
+        if 'file' in failures:
+            logger.error(f"Error in update_item_name: {failures['file']}")
+            self.show_error_dialog("Rename Failed", f"Failed to rename file: {failures['file']}")
+            if item is not None:
+                # Revert the name change in the UI
+                old_parts = old_full_name.split('_')
+                item.setText(updated_column, old_parts[updated_column])
+            return
 
-            # Clear the json_cache for this item
-            self.json_cache.pop(old_full_name, None)
+        logger.info(f"Renamed file from {old_file_path} to {new_file_path}")
+        for label, error in failures.items():
+            logger.error(f"Error updating {label}: {error}")
+            self.show_error_dialog(f"{label.capitalize()} Update Failed", f"Failed to update {label}: {error}")
+
+        # Update the in-memory master data; the master.json write is coalesced
+        entry = self.master_index.pop(old_full_name, None)
+        if entry is not None:
+            entry['File Name'] = new_full_name
+            # Empty values mean the preview was deleted, so only rewrite the set ones;
+            # a preview whose rename failed keeps the path it had
+            if entry.get('Flipbook') and 'flipbook' not in failures:
+                entry['Flipbook'] = FLIPBOOK_ENTRY_TEMPLATE.format(name=new_full_name)
+            if entry.get('Snap') and 'snapshot' not in failures:
+                entry['Snap'] = SNAP_ENTRY_TEMPLATE.format(name=new_full_name)
+            self.master_index[new_full_name] = entry
+            self.mark_master_dirty()
+            logger.info(f"Updated master.json: renamed {old_full_name} to {new_full_name}")
+
+        # Drop cached entries for the old name. After a partial failure the new
+        # name is left out of has_preview, so preview_exists asks the disk again
+        preview_state = self.has_preview.get(old_full_name)
+        self.invalidate_cache(old_full_name)
+        if preview_state is not None and not failures:
+            self.has_preview[new_full_name] = preview_state
+        else:
+            self.has_preview.pop(new_full_name, None)
 
-            self.show_info_dialog("Name Updated", f"Successfully updated the {['Context', 'Type', 'Name', 'Source', 'Version'][updated_column]}")
-            self.refresh_ui()
+        self.show_status_message(f"Updated the {NAME_COLUMNS[updated_column]}")
+        if item is None:
+            self.update_file_list()
+            return
 
-        except Exception as e:
-            logger.error(f"Error in update_item_name: {str(e)}", exc_info=True)
-            self.show_error_dialog("Rename Failed", f"Failed to rename file: {e}")
-            # Revert the name change in the UI
-            old_parts = old_full_name.split('_')
-            item.setText(updated_column, old_parts[updated_column])
+        # Update the item's data
+        self.file_items_by_path.pop(str(old_file_path), None)
+        self.file_items_by_path[str(new_file_path)] = item
+        self._update_item_in_place(item, new_full_name, new_file_path, updated_column)
+
+    def _remove_item_in_place(self, item):
+        # A delete only drops one row, so take it out instead of rescanning the library
+        self.file_rows_user = None  # the cached rows still list the deleted file
+        self.file_items_by_path.pop(item.data(0, QtCore.Qt.UserRole).file_path, None)
+        group_item = item.parent()
+        if group_item is not None:
+            group_item.removeChild(item)
+            if not group_item.childCount():
+                self.file_list_widget.takeTopLevelItem(self.file_list_widget.indexOfTopLevelItem(group_item))
+                self.file_groups.pop(group_item.text(0), None)
+        else:
+            self.file_list_widget.takeTopLevelItem(self.file_list_widget.indexOfTopLevelItem(item))
+
+        # Qt moves the selection to a neighbouring row, which updates the preview itself
+        if _item_file_path(self.file_list_widget.currentItem()) is None:
+            self.clear_preview()
+
+    def _update_item_in_place(self, item, new_full_name: str, new_file_path: Path, updated_column: int):
+        # A rename only touches one row, so patch it instead of rebuilding the tree
+        self.file_rows_user = None  # the cached rows still hold the old name
+        context, file_type, *name_parts, source, version = new_full_name.split('_')
+        texts = [context, file_type, self.camel_case_to_words('_'.join(name_parts)), source, version]
+
+        self.file_list_widget.blockSignals(True)
+        try:
+            for column, text in enumerate(texts):
+                item.setText(column, text)
+            all_texts = [item.text(column) for column in range(item.columnCount())]
+            item.setData(0, QtCore.Qt.UserRole, ItemMeta(str(new_file_path), all_texts))
+
+            selected_group = self.group_combo.currentText() if self.group_checkbox.isChecked() else None
+            group_key = self.get_group_key(context, file_type, source, selected_group)
+            group_item = item.parent()
+            if group_item is not None and group_item.text(0) != group_key:
+                group_item.removeChild(item)
+                if not group_item.childCount():
+                    self.file_list_widget.takeTopLevelItem(self.file_list_widget.indexOfTopLevelItem(group_item))
+                    self.file_groups.pop(group_item.text(0), None)
+
+                group_item = self.file_groups.get(group_key)
+                if group_item is None:
+                    group_item = QtWidgets.QTreeWidgetItem([group_key])
+                    group_item.setFlags(group_item.flags() & ~Qt.ItemIsSelectable)
+                    self.file_list_widget.addTopLevelItem(group_item)
+                    self.file_groups[group_key] = group_item
+                group_item.addChild(item)
+                group_item.setExpanded(True)
+
+            header = self.file_list_widget.header()
+            if group_item is not None and updated_column == header.sortIndicatorSection():
+                group_item.sortChildren(updated_column, header.sortIndicatorOrder())
+        finally:
+            self.file_list_widget.blockSignals(False)
+
+        if updated_column == 3:  # A new source has to show up in the source filter
+            self.populate_source_filter()
+
+        self.file_list_widget.setCurrentItem(item)
+        self.file_list_widget.scrollToItem(item)
+        self.update_preview()
 
-            
     def update_json_data(self, old_name, new_name, new_flipbook_dir, new_snapshot_path):
         try:
-            user = self.user_combo.currentText()
-            master_json_path = self.base_path / 'pyDump' / user / 'Snips' / 'descriptions' / 'master.json'
-            
-            with master_json_path.open('r') as f:
-                data = json.load(f)
-            
-            for item in data:
-                if item['File Name'] == old_name:
-                    item['File Name'] = new_name
-                    if 'Flipbook' in item and new_flipbook_dir.exists():
-                        item['Flipbook'] = f"/preview/flipbook/{new_name}/{new_name}.$F4.png"
-                    if 'Snap' in item and new_snapshot_path.exists():
-                        item['Snap'] = f"/preview/snapshot/{new_name}.png"
-                    break
-            
-            with master_json_path.open('w') as f:
-                json.dump(data, f, indent=4)
+            item = self.master_index.pop(old_name, None)
+            if item is not None:
+                item['File Name'] = new_name
+                # The previews moved with the file, so the scan state for the old name still applies
+                if 'Flipbook' in item and self.preview_exists(old_name, 'flipbook', new_flipbook_dir):
+                    item['Flipbook'] = FLIPBOOK_ENTRY_TEMPLATE.format(name=new_name)
+                if 'Snap' in item and self.preview_exists(old_name, 'snapshot', new_snapshot_path):
+                    item['Snap'] = SNAP_ENTRY_TEMPLATE.format(name=new_name)
+                self.master_index[new_name] = item
+                self.mark_master_dirty()
             
             logger.info(f"Updated JSON data: renamed {old_name} to {new_name}")
         except Exception as e:
-            logger.error(f"Error updating JSON data: {e}", exc_info=True)
+            logger.error(f"Error updating JSON data: {e}", exc_info=logger.isEnabledFor(logging.DEBUG))
             self.show_error_dialog("JSON Update Failed", f"Failed to update JSON data: {e}")
 
         # Clear the cache for this item
-        self.json_cache.pop(old_name, None)
-        cache_keys_to_remove = [key for key in self.preview_cache if old_name in key]
-        for key in cache_keys_to_remove:
-            del self.preview_cache[key]
+        self.invalidate_cache(old_name)
 
         # Refresh the UI
         self.refresh_ui()
 
     def open_write_snip_ui(self):
+        # The writer re-reads master.json from disk, so hand it our pending edits first
+        self.flush_master_json()
+
         # Close existing UI instance if it exists
         if hasattr(hou.session, 'write_snip_ui_instance'):
             try:
@@ -3100,7 +3545,26 @@ class MyShelfToolUI(QtWidgets.QWidget):
         hou.session.write_snip_ui_instance.show()
 
         # Connect the snip_created signal to update the file list
-        hou.session.write_snip_ui_instance.snip_created.connect(self.update_file_list)
+        hou.session.write_snip_ui_instance.snip_created.connect(self.on_snip_created)
+
+    def on_snip_created(self):
+        # The writer saved straight to master.json. Edits made here since the last flush
+        # would be written over it, so fold the writer's new entries in before flushing;
+        # stems already on disk at the last sync were deleted or renamed here, not added
+        if self.master_dirty and self.master_json_path is not None:
+            try:
+                on_disk = read_master_json(self.master_json_path)
+            except Exception as e:
+                logger.error(f"Failed to read master.json after a new snip: {e}")
+                on_disk = []
+            with self.master_lock:
+                for entry in on_disk if isinstance(on_disk, list) else []:
+                    stem = entry.get('File Name')
+                    if stem not in self.master_index and stem not in self.master_disk_stems:
+                        self.json_data.append(entry)
+                        self.master_index[stem] = entry
+        self.load_json_data()
+        self.update_file_list()
 
 
 def show_my_shelf_tool_ui():
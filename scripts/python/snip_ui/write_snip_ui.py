@@ -49,6 +49,9 @@ CONFIG = {
     },
 }
 
+# Characters dropped from generated file names
+FILENAME_STRIP_RE = re.compile(r'[^\w\-_\. ]')
+
 SETTINGS_FILE = os.path.join(os.path.dirname(__file__), 'write_snip_ui_settings.json')
 
 class StyledWidget(QtWidgets.QWidget):
@@ -423,6 +426,7 @@ class WriteSnipUI(StyledWidget):
         self.current_frame = 0
         self.png_timer = QtCore.QTimer(self)
         self.png_timer.timeout.connect(self.update_png_frame)
+        self._gif_movie = None
 
     def change_snip_path(self):
         new_path = QtWidgets.QFileDialog.getExistingDirectory(self, "Select Snip Directory", str(self.current_snip_path))
@@ -584,7 +588,7 @@ class WriteSnipUI(StyledWidget):
 
     @staticmethod
     def to_camel_case(text):
-        text = re.sub(r'[^\w\-_\. ]', '', text).replace(' ', '_')
+        text = FILENAME_STRIP_RE.sub('', text).replace(' ', '_')
         words = text.split('_')
         return words[0].lower() + ''.join(word.capitalize() for word in words[1:])
 
@@ -638,7 +642,7 @@ class WriteSnipUI(StyledWidget):
         self.current_snapshot_path = None
 
     def sanitize_filename(self, filename: str) -> str:
-        return re.sub(r'[^\w\-_\. ]', '', filename).replace(' ', '_')
+        return FILENAME_STRIP_RE.sub('', filename).replace(' ', '_')
 
     def verify_and_capture_flipbook(self):
         print("Flipbook button clicked")
@@ -688,7 +692,9 @@ class WriteSnipUI(StyledWidget):
         flipbook_sequence_folder.mkdir(parents=True, exist_ok=True)
         
         try:
-            hou.hipFile.save()
+            # Only rewrite the .hip when there is something to save
+            if hou.hipFile.hasUnsavedChanges():
+                hou.hipFile.save()
             scene_viewer = toolutils.sceneViewer()
             flipbook_settings = scene_viewer.flipbookSettings()
             flipbook_settings.frameRange((start_frame, end_frame))
@@ -701,7 +707,7 @@ class WriteSnipUI(StyledWidget):
             scene_viewer.flipbook(settings=flipbook_settings)
             
             progress.setValue(end_frame)
-            QtWidgets.QApplication.processEvents()
+            QtCore.QCoreApplication.sendPostedEvents(progress, 0)
             
             progress.close()
             
@@ -762,10 +768,21 @@ class WriteSnipUI(StyledWidget):
         else:
             self.update_gif_preview()
 
+    @property
+    def gif_movie(self) -> QMovie:
+        # Built on first use and reused, so PNG-only sessions never create one
+        # and each GIF is decoded once rather than on every loop
+        if self._gif_movie is None:
+            self._gif_movie = QMovie(self)
+            self._gif_movie.setCacheMode(QMovie.CacheAll)
+        return self._gif_movie
+
     def update_gif_preview(self):
         gif_path = self.current_flipbook_path.with_suffix('.gif')
         if gif_path.exists():
-            movie = QMovie(str(gif_path))
+            movie = self.gif_movie
+            movie.stop()
+            movie.setFileName(str(gif_path))
             movie.setScaledSize(self.flipbook_preview.size())
             self.flipbook_preview.setMovie(movie)
             movie.start()
@@ -795,6 +812,8 @@ class WriteSnipUI(StyledWidget):
     def toggle_preview_mode(self, button):
         if button == self.png_radio:
             self.preview_mode = "png"
+            if self._gif_movie is not None:
+                self._gif_movie.stop()
             self.png_timer.start(100)
         else:
             self.preview_mode = "gif"
@@ -953,8 +972,11 @@ class WriteSnipUI(StyledWidget):
         master_data.insert(0, new_entry)
 
         try:
-            with open(master_json_path, 'w') as master_file:
+            # Swap a finished file into place so the library UI never reads a half-written one
+            tmp_path = master_json_path.with_suffix('.json.tmp')
+            with open(tmp_path, 'w') as master_file:
                 json.dump(master_data, master_file, indent=4)
+            os.replace(tmp_path, master_json_path)
         except Exception as e:
             logger.error(f"Error writing to master JSON: {e}")
             QtWidgets.QMessageBox.critical(self, "Error", f"Failed to update master JSON: {e}")